@@ -71,15 +71,31 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="変更を監視し自動的に書き戻すデーモンモードで実行",
     )
+    parser.add_argument(
+        "--no-writeback",
+        action="store_true",
+        help="出力ディレクトリの変更監視（ソースへの書き戻し）を無効化",
+    )
     parser.add_argument(
         "--fallback-charset",
         help="新規ファイル作成時に使用するエンコーディング（省略時は--toの値を使用）",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="ファイル変換の並列プロセス数（デフォルト: 1、逐次実行）",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="OSのファイル変更通知を使わずポーリングで監視（NFSなど通知が届かない環境向け）",
+    )
     parser.add_argument(
         "--watch-interval",
         type=float,
         default=1.0,
-        help="監視間隔を秒単位で指定（デフォルト: 1.0）",
+        help="ポーリング時の監視間隔を秒単位で指定（デフォルト: 1.0）",
     )
 
     return parser.parse_args()
@@ -125,6 +141,7 @@ def main() -> int:
             exclude_patterns=exclude_patterns,
             verbose=args.verbose,
             fallback_charset=args.fallback_charset,
+            jobs=args.jobs,
         )
 
         if args.watch:
@@ -134,6 +151,8 @@ def main() -> int:
                 dst_dir=args.output_dir,
                 converter=converter,
                 interval=args.watch_interval,
+                use_polling=args.poll,
+                watch_dst=not args.no_writeback,
             )
             watcher.start()
 
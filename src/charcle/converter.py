@@ -4,19 +4,101 @@
 このモジュールは、ファイルのエンコーディングを変換するための機能を提供します。
 """
 
+import json
 import logging
+import mmap
 import os
 import shutil
+import stat
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-from charcle.utils.encoding import convert_encoding, detect_encoding
+from charcle.utils.encoding import (
+    convert_encoding,
+    convert_encoding_streaming,
+    detect_encoding,
+    detect_encoding_streaming,
+    normalize_encoding,
+)
 from charcle.utils.filesystem import (
+    ExcludeMatcher,
     copy_metadata,
     handle_symlink,
     is_text_file,
     parse_size,
-    should_exclude,
 )
 
+# これ未満のサイズのファイルは従来どおり全読み込みしてから検出する
+_STREAM_DETECT_MIN_SIZE = 8192
+
+# これ以上のサイズのファイルはread()によるコピーを避けてmmap経由でデコードする
+_MMAP_MIN_SIZE = 65536
+
+# これ以上のサイズのファイルはインクリメンタルコーデックでストリーミング変換する
+_STREAM_CONVERT_MIN_SIZE = 1048576
+
+# これ未満のファイル数ではプロセスプールの起動コストの方が高くつくため逐次処理する
+_MIN_PARALLEL_TASKS = 4
+
+# 変換済みファイルのソース側(mtime_ns, サイズ)を記録するマニフェスト（dst直下）
+MANIFEST_NAME = ".charcle-cache.json"
+
+_worker_converter: "Converter | None" = None
+
+
+def _init_worker(
+    from_encoding: str | None,
+    to_encoding: str,
+    max_size: str | None,
+    verbose: bool,
+    fallback_charset: str | None,
+) -> None:
+    """
+    ワーカープロセスごとにコンバーターを初期化します。
+
+    Args:
+        from_encoding: 入力エンコーディング
+        to_encoding: 出力エンコーディング
+        max_size: 変換する最大ファイルサイズ
+        verbose: 詳細なログ出力を有効にするかどうか
+        fallback_charset: 新規ファイル作成時に使用するエンコーディング
+    """
+    global _worker_converter
+    _worker_converter = Converter(
+        from_encoding=from_encoding,
+        to_encoding=to_encoding,
+        max_size=max_size,
+        verbose=verbose,
+        fallback_charset=fallback_charset,
+    )
+
+
+def _convert_file_job(
+    src_file: str, dst_file: str
+) -> "tuple[str | None, tuple[int, int] | None]":
+    """
+    ワーカープロセス内で単一ファイルを変換します。
+
+    ワーカーのコンバーターはマニフェストを持たないため、記録に必要な
+    ソース側の(st_mtime_ns, サイズ)を親プロセスへ返します。
+
+    Args:
+        src_file: ソースファイルのパス
+        dst_file: 宛先ファイルのパス
+
+    Returns:
+        (エラーメッセージ（成功時はNone）, ソースの(st_mtime_ns, サイズ))のタプル
+    """
+    assert _worker_converter is not None
+    try:
+        _worker_converter.convert_file(src_file, dst_file)
+    except Exception as e:
+        return str(e), None
+    src_stat = _worker_converter._stat_source(src_file, None)
+    if src_stat is None:
+        return None, None
+    return None, (src_stat.st_mtime_ns, src_stat.st_size)
+
 
 class Converter:
     """
@@ -31,6 +113,7 @@ class Converter:
         exclude_patterns: list[str] | None = None,
         verbose: bool = False,
         fallback_charset: str | None = None,
+        jobs: int = 1,
     ):
         """
         コンバーターを初期化します。
@@ -42,13 +125,26 @@ class Converter:
             exclude_patterns: 除外するファイルパターンのリスト
             verbose: 詳細なログ出力を有効にするかどうか
             fallback_charset: 新規ファイル作成時に使用するエンコーディング（Noneの場合は--toの値）
+            jobs: ファイル変換の並列プロセス数（1の場合は逐次実行）
         """
         self.from_encoding = from_encoding
         self.to_encoding = to_encoding
+        self.max_size = max_size
         self.max_size_bytes = parse_size(max_size) if max_size else None
         self.exclude_patterns = exclude_patterns or []
+        self.exclude_matcher = ExcludeMatcher(self.exclude_patterns)
         self.verbose = verbose
         self.fallback_charset = fallback_charset
+        self.jobs = jobs
+        # 入出力エンコーディングが同じ場合、変換は純粋なコピーに縮退できる
+        self._identity = (
+            from_encoding is not None
+            and normalize_encoding(from_encoding) == normalize_encoding(to_encoding)
+        )
+        # 変換マニフェスト（convert_directoryで読み込まれるまでは無効）
+        self._manifest: dict[str, list[int]] | None = None
+        self._manifest_root: str | None = None
+        self._manifest_dirty = False
 
         self.logger = logging.getLogger("charcle")
         if not self.logger.handlers:
@@ -58,6 +154,39 @@ class Converter:
             self.logger.addHandler(handler)
         self.logger.setLevel(logging.DEBUG if verbose else logging.INFO)
 
+    def _scan(self, src_root: str) -> Iterator[tuple[os.DirEntry[str], str]]:
+        """
+        ディレクトリツリーを走査し、(DirEntry, 相対パス)のペアを生成します。
+
+        os.walkと異なりDirEntryオブジェクトをそのまま返すため、
+        呼び出し側はキャッシュされたstat情報を追加のシステムコールなしで利用できます。
+        除外パターンに一致するディレクトリは再帰せずスキップします。
+
+        Args:
+            src_root: 走査を開始するディレクトリのパス
+
+        Yields:
+            (DirEntry, src_rootからの相対パス)のタプル
+        """
+        stack: list[tuple[str, str]] = [(src_root, "")]
+        while stack:
+            abs_dir, rel_dir = stack.pop()
+            try:
+                entries = list(os.scandir(abs_dir))
+            except OSError as e:
+                self.logger.error("Error scanning %s: %s", abs_dir, e)
+                continue
+
+            for entry in entries:
+                rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if self.exclude_matcher.matches(rel_path):
+                        continue
+                    yield entry, rel_path
+                    stack.append((entry.path, rel_path))
+                else:
+                    yield entry, rel_path
+
     def convert_directory(self, src_dir: str, dst_dir: str) -> None:
         """
         ディレクトリ全体のファイルエンコーディングを変換します。
@@ -69,87 +198,423 @@ class Converter:
         src_dir = os.path.abspath(src_dir)
         dst_dir = os.path.abspath(dst_dir)
 
-        if not os.path.exists(dst_dir):
-            os.makedirs(dst_dir)
+        os.makedirs(dst_dir, exist_ok=True)
+        self._load_manifest(dst_dir)
+
+        tasks: list[tuple[str, str]] = []
+        seen_keys: set[str] = set()
+        for entry, rel_path in self._scan(src_dir):
+            dst_path = os.path.join(dst_dir, rel_path)
+
+            if entry.is_dir(follow_symlinks=False):
+                # exists+makedirsの2回のstatを避け、新規作成時だけメタデータをコピー
+                try:
+                    os.makedirs(dst_path)
+                except FileExistsError:
+                    pass
+                else:
+                    copy_metadata(entry.path, dst_path)
+                continue
+
+            if self.exclude_matcher.matches(rel_path):
+                self.logger.debug("Skipping excluded file: %s", rel_path)
+                continue
+
+            seen_keys.add(rel_path)
+            try:
+                if entry.is_symlink():
+                    # シンボリックリンクはdst_rootの作成と競合しないようメインプロセスで処理
+                    self.logger.debug("Processing symlink: %s", rel_path)
+                    handle_symlink(entry.path, dst_path, src_dir, dst_dir)
+                elif self.jobs > 1:
+                    tasks.append((entry.path, dst_path))
+                else:
+                    self.convert_file(entry.path, dst_path, entry=entry)
+            except Exception as e:
+                self.logger.error("Error processing %s: %s", rel_path, e)
+
+        if tasks:
+            self._convert_files_parallel(tasks)
+        self._prune_manifest(seen_keys)
+        self._save_manifest()
 
-        for root, dirs, files in os.walk(src_dir):
-            rel_path = os.path.relpath(root, src_dir)
-            dst_root = os.path.join(dst_dir, rel_path) if rel_path != "." else dst_dir
+    def _load_manifest(self, dst_dir: str) -> None:
+        """
+        宛先ディレクトリ直下のマニフェストを読み込みます。
 
-            dirs[:] = [
-                d for d in dirs
-                if not should_exclude(os.path.join(rel_path, d), self.exclude_patterns)
-            ]
+        マニフェストは変換済みファイルのソース側の(mtime_ns, サイズ)を記録した
+        JSONで、一致するファイルはmtime比較によらずスキップできます。
+        存在しない・壊れている場合は空の状態から始めます。
 
-            if not os.path.exists(dst_root):
-                os.makedirs(dst_root)
-                copy_metadata(root, dst_root)
+        Args:
+            dst_dir: 宛先ディレクトリのパス
+        """
+        self._manifest_root = dst_dir
+        self._manifest_dirty = False
+        self._manifest = {}
+        try:
+            with open(os.path.join(dst_dir, MANIFEST_NAME), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._manifest = {
+                key: value
+                for key, value in data.items()
+                if isinstance(value, list)
+                and len(value) == 2
+                and all(isinstance(item, int) for item in value)
+            }
 
-            for file in files:
-                src_file = os.path.join(root, file)
-                dst_file = os.path.join(dst_root, file)
-                rel_file_path = os.path.join(rel_path, file)
+    def _save_manifest(self) -> None:
+        """
+        マニフェストを一時ファイル経由でアトミックに書き出します。
+        """
+        if not self._manifest_dirty or self._manifest_root is None:
+            return
+        path = os.path.join(self._manifest_root, MANIFEST_NAME)
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._manifest, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug("Error saving manifest: %s", e)
+        else:
+            self._manifest_dirty = False
 
-                if should_exclude(rel_file_path, self.exclude_patterns):
-                    self.logger.debug(f"Skipping excluded file: {rel_file_path}")
-                    continue
+    def _manifest_key(self, dst_file: str) -> str:
+        """
+        宛先ファイルのパスからマニフェストのキー（相対パス）を求めます。
 
+        Args:
+            dst_file: 宛先ファイルのパス
+
+        Returns:
+            マニフェストのキーとして使う相対パス
+        """
+        root = self._manifest_root or ""
+        if dst_file.startswith(root + os.sep):
+            return dst_file[len(root) + 1:]
+        return os.path.relpath(dst_file, root)
+
+    def _record_manifest(
+        self, dst_file: str, src_stat: "os.stat_result | None"
+    ) -> None:
+        """
+        変換したファイルのソース側の状態をマニフェストに記録します。
+
+        Args:
+            dst_file: 宛先ファイルのパス
+            src_stat: ソースファイルのstat結果（Noneの場合は何もしない）
+        """
+        if src_stat is None:
+            return
+        self._record_manifest_sig(dst_file, (src_stat.st_mtime_ns, src_stat.st_size))
+
+    def _record_manifest_sig(
+        self, dst_file: str, src_sig: "tuple[int, int] | None"
+    ) -> None:
+        """
+        ソース側の(st_mtime_ns, サイズ)の組をマニフェストに記録します。
+
+        Args:
+            dst_file: 宛先ファイルのパス
+            src_sig: ソースの(st_mtime_ns, サイズ)（Noneの場合は何もしない）
+        """
+        if self._manifest is None or self._manifest_root is None or src_sig is None:
+            return
+        self._manifest[self._manifest_key(dst_file)] = list(src_sig)
+        self._manifest_dirty = True
+
+    def _prune_manifest(self, seen_keys: set[str]) -> None:
+        """
+        今回の走査で見つからなかったソースのエントリをマニフェストから除きます。
+
+        実行の合間に削除されたソースのエントリを残したままにすると、
+        マニフェストが際限なく肥大化するためです。
+
+        Args:
+            seen_keys: 今回の走査で変換対象になった相対パスの集合
+        """
+        if self._manifest is None:
+            return
+        stale = self._manifest.keys() - seen_keys
+        for key in stale:
+            del self._manifest[key]
+        if stale:
+            self._manifest_dirty = True
+
+    def discard_manifest_entry(self, dst_file: str) -> None:
+        """
+        宛先ファイルに対応するマニフェストエントリを削除します。
+
+        ファイル削除後に同じmtime・サイズで再作成された場合に
+        誤ってスキップしないよう、削除処理から呼び出されます。
+
+        Args:
+            dst_file: 宛先ファイルのパス
+        """
+        if self._manifest is None or self._manifest_root is None:
+            return
+        if self._manifest.pop(self._manifest_key(dst_file), None) is not None:
+            self._manifest_dirty = True
+
+    def _convert_files_parallel(self, tasks: list[tuple[str, str]]) -> None:
+        """
+        ファイル変換タスクをプロセスプールで並列実行します。
+
+        プール起動コストの方が高くつく少数のタスクは逐次処理に切り替えます。
+
+        Args:
+            tasks: (ソースファイル, 宛先ファイル)のペアのリスト
+        """
+        if len(tasks) < _MIN_PARALLEL_TASKS:
+            for src_file, dst_file in tasks:
                 try:
-                    if os.path.islink(src_file):
-                        self.logger.debug(f"Processing symlink: {rel_file_path}")
-                        handle_symlink(src_file, dst_file, src_dir, dst_dir)
-                    else:
-                        self.convert_file(src_file, dst_file)
+                    self.convert_file(src_file, dst_file)
                 except Exception as e:
-                    self.logger.error(f"Error processing {rel_file_path}: {str(e)}")
+                    self.logger.error("Error processing %s: %s", src_file, e)
+            return
+
+        initargs = (
+            self.from_encoding,
+            self.to_encoding,
+            self.max_size,
+            self.verbose,
+            self.fallback_charset,
+        )
+        with ProcessPoolExecutor(
+            max_workers=self.jobs, initializer=_init_worker, initargs=initargs
+        ) as executor:
+            futures = {
+                executor.submit(_convert_file_job, src_file, dst_file): (src_file, dst_file)
+                for src_file, dst_file in tasks
+            }
+            for future in as_completed(futures):
+                src_file, dst_file = futures[future]
+                error, src_sig = future.result()
+                if error is not None:
+                    self.logger.error("Error processing %s: %s", src_file, error)
+                else:
+                    # ワーカーはマニフェストを持たないため、親プロセス側で記録する
+                    self._record_manifest_sig(dst_file, src_sig)
 
-    def convert_file(self, src_file: str, dst_file: str) -> None:
+    def convert_file(
+        self, src_file: str, dst_file: str, entry: os.DirEntry[str] | None = None
+    ) -> None:
         """
         単一ファイルのエンコーディングを変換します。
 
         Args:
             src_file: ソースファイルのパス
             dst_file: 宛先ファイルのパス
+            entry: ソースファイルに対応するDirEntry（statキャッシュの再利用用）
         """
-        if os.path.exists(dst_file) and os.path.isfile(dst_file) and os.path.isfile(src_file):
-            dst_mtime = os.path.getmtime(dst_file)
-            src_mtime = os.path.getmtime(src_file)
-            if dst_mtime >= src_mtime:
-                self.logger.info(f"Skipped {src_file} (not modified since last conversion)")
-                return
+        src_stat = self._stat_source(src_file, entry)
+        if src_stat is not None and self._should_skip(src_stat, dst_file):
+            self.logger.info("Skipped %s (not modified since last conversion)", src_file)
+            return
 
-        if is_text_file(src_file, self.max_size_bytes):
+        if self._identity:
+            # 読み込みも検出も不要：バイト列とメタデータをそのままコピー
+            shutil.copy2(src_file, dst_file)
+            self.logger.info(
+                "Converted %s from %s to %s", src_file, self.from_encoding, self.to_encoding
+            )
+            self._record_manifest(dst_file, src_stat)
+            return
+
+        if is_text_file(src_file, self.max_size_bytes, entry=entry):
             try:
-                with open(src_file, "rb") as f:
-                    content = f.read()
-
-                from_encoding = self.from_encoding
-                confidence = 1.0
-                if from_encoding is None:
-                    from_encoding, confidence = detect_encoding(content)
-
-                if confidence < 0.7:
-                    self.logger.warning(
-                        f"Low confidence ({confidence:.2f}) in encoding detection for "
-                        f"{src_file}: {from_encoding}"
-                    )
+                self._convert_text_file(src_file, dst_file, entry)
+            except Exception as e:
+                shutil.copy2(src_file, dst_file)
+                self.logger.error("Error converting %s: %s", src_file, e)
+        else:
+            shutil.copy2(src_file, dst_file)
+            self.logger.debug("Copied binary file: %s", src_file)
+        self._record_manifest(dst_file, src_stat)
+
+    def _stat_source(
+        self, src_file: str, entry: os.DirEntry[str] | None
+    ) -> "os.stat_result | None":
+        """
+        ソースが通常ファイルの場合にstat結果を返します。
 
-                converted, success = convert_encoding(content, from_encoding, self.to_encoding)
+        DirEntry経由ならキャッシュ済みのstat結果を再利用するため
+        追加のシステムコールが発生しません。
 
-                if success:
-                    with open(dst_file, "wb") as f:
-                        f.write(converted)
-                    self.logger.info(
-                        f"Converted {src_file} from {from_encoding} to {self.to_encoding}"
+        Args:
+            src_file: ソースファイルのパス
+            entry: ソースファイルに対応するDirEntry
+
+        Returns:
+            通常ファイルの場合はstat結果、そうでない場合はNone
+        """
+        try:
+            if entry is not None:
+                if not entry.is_file(follow_symlinks=False):
+                    return None
+                return entry.stat(follow_symlinks=False)
+            src_stat = os.stat(src_file)
+        except OSError:
+            return None
+        return src_stat if stat.S_ISREG(src_stat.st_mode) else None
+
+    def _should_skip(self, src_stat: os.stat_result, dst_file: str) -> bool:
+        """
+        宛先が変換元と同期済みで変換をスキップできるかを判定します。
+
+        Args:
+            src_stat: ソースファイルのstat結果
+            dst_file: 宛先ファイルのパス
+
+        Returns:
+            スキップできる場合はTrue
+        """
+        try:
+            dst_stat = os.stat(dst_file)
+        except OSError:
+            # 宛先が外部で削除されている場合はマニフェストが一致していても再変換する
+            return False
+        if not stat.S_ISREG(dst_stat.st_mode):
+            return False
+        if self._manifest is not None and self._manifest_root is not None:
+            cached = self._manifest.get(self._manifest_key(dst_file))
+            if cached == [src_stat.st_mtime_ns, src_stat.st_size]:
+                return True
+        return dst_stat.st_mtime_ns >= src_stat.st_mtime_ns
+
+    def _convert_text_file(
+        self, src_file: str, dst_file: str, entry: os.DirEntry[str] | None
+    ) -> None:
+        """
+        テキストファイルのエンコーディングを検出・変換して書き出します。
+
+        Args:
+            src_file: ソースファイルのパス
+            dst_file: 宛先ファイルのパス
+            entry: ソースファイルに対応するDirEntry（statキャッシュの再利用用）
+        """
+        from_encoding = self.from_encoding
+        confidence = 1.0
+        file_size = (
+            entry.stat(follow_symlinks=False).st_size if entry is not None
+            else os.path.getsize(src_file)
+        )
+        if from_encoding is None and file_size >= _STREAM_DETECT_MIN_SIZE:
+            # 大きなファイルは全読み込み前にチャンク検出で確定させる
+            from_encoding, confidence = detect_encoding_streaming(src_file)
+
+        if from_encoding is not None and file_size >= _STREAM_CONVERT_MIN_SIZE:
+            # 巨大なファイルは全体を載せずチャンク単位で変換する
+            self._convert_text_file_streaming(src_file, dst_file, from_encoding, confidence)
+            return
+
+        if from_encoding is not None and file_size >= _MMAP_MIN_SIZE:
+            # 大きなファイルはマッピングから直接デコードし、read()のコピーを省く
+            with open(src_file, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    self._finish_text_conversion(
+                        src_file, dst_file, mm, from_encoding, confidence
                     )
-                else:
-                    shutil.copy2(src_file, dst_file)
-                    self.logger.warning(f"Failed to convert {src_file}, copied as binary")
-            except Exception as e:
-                shutil.copy2(src_file, dst_file)
-                self.logger.error(f"Error converting {src_file}: {str(e)}")
+            return
+
+        # バッファドIOの中間バッファを挟まず、ファイル全体を一度に読み込む
+        with open(src_file, "rb", buffering=0) as f:
+            content = f.read()
+
+        if from_encoding is None:
+            from_encoding, confidence = detect_encoding(content)
+
+        self._finish_text_conversion(src_file, dst_file, content, from_encoding, confidence)
+
+    def _warn_low_confidence(
+        self, src_file: str, from_encoding: str, confidence: float
+    ) -> None:
+        """
+        エンコーディング検出の信頼度が低い場合に警告を出力します。
+
+        Args:
+            src_file: ソースファイルのパス
+            from_encoding: 検出されたエンコーディング
+            confidence: エンコーディング検出の信頼度
+        """
+        if confidence < 0.7:
+            self.logger.warning(
+                "Low confidence (%.2f) in encoding detection for %s: %s",
+                confidence, src_file, from_encoding
+            )
+
+    def _convert_text_file_streaming(
+        self, src_file: str, dst_file: str, from_encoding: str, confidence: float
+    ) -> None:
+        """
+        巨大なテキストファイルをストリーミングで変換して書き出します。
+
+        Args:
+            src_file: ソースファイルのパス
+            dst_file: 宛先ファイルのパス
+            from_encoding: 変換元のエンコーディング
+            confidence: エンコーディング検出の信頼度
+        """
+        self._warn_low_confidence(src_file, from_encoding, confidence)
+
+        if normalize_encoding(from_encoding) == normalize_encoding(self.to_encoding):
+            # 検出結果が出力エンコーディングと一致：変換不要なのでコピーに縮退
+            shutil.copy2(src_file, dst_file)
+            self.logger.info(
+                "Converted %s from %s to %s", src_file, from_encoding, self.to_encoding
+            )
+            return
+
+        with open(src_file, "rb") as src_fp, open(dst_file, "wb") as dst_fp:
+            success = convert_encoding_streaming(
+                src_fp, dst_fp, from_encoding, self.to_encoding
+            )
+
+        if success:
+            copy_metadata(src_file, dst_file)
+            self.logger.info(
+                "Converted %s from %s to %s", src_file, from_encoding, self.to_encoding
+            )
         else:
             shutil.copy2(src_file, dst_file)
-            self.logger.debug(f"Copied binary file: {src_file}")
+            self.logger.warning("Failed to convert %s, copied as binary", src_file)
+
+    def _finish_text_conversion(
+        self,
+        src_file: str,
+        dst_file: str,
+        content: "bytes | mmap.mmap",
+        from_encoding: str,
+        confidence: float,
+    ) -> None:
+        """
+        検出済みのエンコーディングでコンテンツを変換して書き出します。
 
-        copy_metadata(src_file, dst_file)
+        Args:
+            src_file: ソースファイルのパス
+            dst_file: 宛先ファイルのパス
+            content: ソースファイルの内容（bytesまたは読み込み用mmap）
+            from_encoding: 変換元のエンコーディング
+            confidence: エンコーディング検出の信頼度
+        """
+        self._warn_low_confidence(src_file, from_encoding, confidence)
+
+        converted, success = convert_encoding(content, from_encoding, self.to_encoding)
+
+        if success:
+            # 変換済みバイト列は1回のwriteで書けるため、バッファリングは不要
+            with open(dst_file, "wb", buffering=0) as f:
+                f.write(converted)
+            copy_metadata(src_file, dst_file)
+            self.logger.info(
+                "Converted %s from %s to %s", src_file, from_encoding, self.to_encoding
+            )
+        else:
+            # copy2がパーミッションとタイムスタンプも複製するため
+            # copy_metadataを重ねて呼ぶ必要はない
+            shutil.copy2(src_file, dst_file)
+            self.logger.warning("Failed to convert %s, copied as binary", src_file)
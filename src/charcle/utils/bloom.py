@@ -0,0 +1,94 @@
+"""
+カウンティングブルームフィルタ
+
+このモジュールは、メンバーシップ判定用の省メモリなデータ構造を提供します。
+パス文字列の集合をsetで保持するとツリーの規模に比例してメモリを消費するため、
+要素数によらず固定サイズで済む確率的な集合として利用します。
+"""
+
+import hashlib
+from array import array
+
+
+class CountingBloomFilter:
+    """
+    削除に対応したブルームフィルタ
+
+    通常のブルームフィルタと異なり、ビットの代わりに8ビットカウンタを持つため
+    要素の削除（discard）が可能です。メンバーシップ判定は確率的で、
+    偽陽性（含まれていないのに含まれていると判定される）はあり得ますが、
+    偽陰性はありません。カウンタは255で飽和し、それ以上は増減しません。
+    """
+
+    def __init__(self, size: int = 1 << 20, num_hashes: int = 2):
+        """
+        フィルタを初期化します。
+
+        デフォルトの1Miカウンタ（1MB固定）で、10万要素に対して
+        偽陽性率はおよそ3%です。
+
+        Args:
+            size: カウンタ配列の長さ
+            num_hashes: 要素ごとに立てるカウンタの数
+        """
+        self._size = size
+        self._num_hashes = num_hashes
+        self._counters = array("B", bytes(size))
+
+    def _indexes(self, item: str) -> list[int]:
+        """
+        要素に対応するカウンタ位置を計算します。
+
+        Args:
+            item: 対象の要素
+
+        Returns:
+            カウンタ配列内の位置のリスト
+        """
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little")
+        return [(h1 + i * h2) % self._size for i in range(self._num_hashes)]
+
+    def add(self, item: str) -> None:
+        """
+        要素を追加します。
+
+        Args:
+            item: 追加する要素
+        """
+        for index in self._indexes(item):
+            if self._counters[index] < 255:
+                self._counters[index] += 1
+
+    def discard(self, item: str) -> None:
+        """
+        要素を削除します。
+
+        含まれていない（可能性が高い）要素に対しては何もしません。
+
+        Args:
+            item: 削除する要素
+        """
+        indexes = self._indexes(item)
+        if all(self._counters[index] for index in indexes):
+            for index in indexes:
+                if self._counters[index] < 255:  # 飽和したカウンタは減らせない
+                    self._counters[index] -= 1
+
+    def __contains__(self, item: object) -> bool:
+        """
+        要素が含まれている可能性があるかどうかを判定します。
+
+        Containerプロトコルに合わせて任意のオブジェクトを受け付けますが、
+        文字列以外は常に含まれていないと判定します。
+
+        Args:
+            item: 判定する要素
+
+        Returns:
+            含まれている可能性がある場合はTrue、確実に含まれていない場合はFalse
+        """
+        if not isinstance(item, str):
+            return False
+        return all(self._counters[index] for index in self._indexes(item))
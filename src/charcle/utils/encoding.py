@@ -5,7 +5,21 @@
 異なるエンコーディング間で変換するための機能を提供します。
 """
 
-import chardet
+import codecs
+import functools
+import hashlib
+import mmap
+import threading
+from collections import OrderedDict
+from typing import BinaryIO, overload
+
+from chardet import UniversalDetector
+
+try:
+    # 任意の高速な検出バックエンド（pip install charcle[speed] で有効化）
+    from charset_normalizer import from_bytes as _normalizer_from_bytes
+except ImportError:
+    _normalizer_from_bytes = None  # type: ignore[assignment]
 
 SUPPORTED_ENCODINGS: list[str] = [
     "utf-8",
@@ -20,14 +34,54 @@ ENCODING_ALIASES: dict[str, str] = {
     "windows-31j": "shift-jis",
     "cp932": "shift-jis",
     "eucjp": "euc-jp",
+    "euc_jp": "euc-jp",  # charset-normalizerはPython内部のコーデック名を返す
     "ujis": "euc-jp",
+    "utf_8": "utf-8",
     "jis": "iso-2022-jp",
+    "iso2022_jp": "iso-2022-jp",
 }
 
+# メンバーシップ判定用のfrozenset（リスト走査を避ける）
+_SUPPORTED_SET = frozenset(SUPPORTED_ENCODINGS)
+
+# ASCIIとバイト互換なエンコーディング。純ASCIIのバイト列はこれらの間で
+# 同一表現になるため、デコード・再エンコードせずそのまま流用できる。
+_ASCII_COMPATIBLE = frozenset({"ascii", "utf-8", "euc-jp", "shift-jis", "iso-2022-jp"})
+
+# ストリーミング変換で一度に処理するチャンクサイズ
+_STREAM_CHUNK_SIZE = 65536
+
+# 検出結果のキャッシュ（キー: (先頭64KBのハッシュ, コンテンツ長, フォールバック)）
+_DETECT_CACHE: OrderedDict[tuple[bytes, int, str], tuple[str, float]] = OrderedDict()
+_DETECT_CACHE_MAX = 1024
+
+# UniversalDetectorの構築は多数のプローバーを初期化するため、
+# ファイルごとに作り直さずスレッドごとに1つをreset()で使い回す
+_detector_local = threading.local()
+
+
+def _shared_detector() -> UniversalDetector:
+    """
+    リセット済みの再利用可能なUniversalDetectorを返します。
+
+    Returns:
+        呼び出し元スレッド専用のUniversalDetector
+    """
+    detector: UniversalDetector | None = getattr(_detector_local, "detector", None)
+    if detector is None:
+        detector = UniversalDetector()
+        _detector_local.detector = detector
+    detector.reset()
+    return detector
+
+
+@functools.lru_cache(maxsize=64)
 def normalize_encoding(encoding: str) -> str:
     """
     エンコーディング名を正規化します。
 
+    実際に現れるエンコーディング名は十数種類程度なので結果をキャッシュします。
+
     Args:
         encoding: 正規化するエンコーディング名
 
@@ -38,6 +92,7 @@ def normalize_encoding(encoding: str) -> str:
     return ENCODING_ALIASES.get(encoding, encoding)
 
 
+@functools.lru_cache(maxsize=64)
 def is_supported_encoding(encoding: str) -> bool:
     """
     指定されたエンコーディングがサポートされているかを確認します。
@@ -49,7 +104,45 @@ def is_supported_encoding(encoding: str) -> bool:
         サポートされている場合はTrue、そうでない場合はFalse
     """
     normalized = normalize_encoding(encoding)
-    return normalized in SUPPORTED_ENCODINGS
+    return normalized in _SUPPORTED_SET
+
+
+@functools.lru_cache(maxsize=64)
+def _codec_info(encoding: str) -> codecs.CodecInfo:
+    """
+    コーデック情報を名前解決込みでキャッシュして返します。
+
+    bytes.decode / str.encodeは呼び出しのたびに名前からコーデックを
+    解決するため、数千ファイルを変換する場合はその分の辞書引きと
+    エイリアス解決が積み重なります。CodecInfoを直接持てば省略できます。
+
+    Args:
+        encoding: エンコーディング名
+
+    Returns:
+        対応するCodecInfo
+    """
+    return codecs.lookup(encoding)
+
+
+def _detect_bom(prefix: bytes) -> str | None:
+    """
+    先頭バイトのBOMからエンコーディングを判定します。
+
+    Args:
+        prefix: ファイルの先頭バイト列
+
+    Returns:
+        BOMが見つかった場合はエンコーディング名、見つからない場合はNone
+    """
+    if prefix.startswith(codecs.BOM_UTF8):
+        return "utf-8"
+    # UTF-32LEのBOMはUTF-16LEのBOMで始まるため、先に4バイトの方を調べる
+    if prefix.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+        return "utf-32"
+    if prefix.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    return None
 
 
 def detect_encoding(content: bytes, fallback: str = "utf-8") -> tuple[str, float]:
@@ -66,13 +159,113 @@ def detect_encoding(content: bytes, fallback: str = "utf-8") -> tuple[str, float
     if not content:
         return fallback, 1.0
 
-    is_ascii_only = all(b <= 127 for b in content)
-    if is_ascii_only:
+    # BOM付きファイルと純ASCIIは検出器を呼ばずに確定できる
+    bom_encoding = _detect_bom(content)
+    if bom_encoding is not None:
+        return bom_encoding, 1.0
+
+    if content.isascii():
+        return "ascii", 1.0
+
+    # 同一コンテンツの再検出を避ける（watchモードで同じファイルを繰り返し検出する場合など）
+    key = (hashlib.blake2b(content[:65536], digest_size=16).digest(), len(content), fallback)
+    cached = _DETECT_CACHE.get(key)
+    if cached is not None:
+        _DETECT_CACHE.move_to_end(key)
+        return cached
+
+    encoding, confidence = _detect_bytes(content)
+
+    if encoding is None:
+        result = fallback, 0.0
+    else:
+        normalized = normalize_encoding(encoding)
+        if not is_supported_encoding(normalized):
+            result = fallback, 0.0
+        else:
+            result = normalized, confidence
+
+    _DETECT_CACHE[key] = result
+    if len(_DETECT_CACHE) > _DETECT_CACHE_MAX:
+        _DETECT_CACHE.popitem(last=False)
+    return result
+
+
+def _detect_bytes(content: bytes) -> tuple[str | None, float]:
+    """
+    バイナリコンテンツのエンコーディングを検出バックエンドで推定します。
+
+    charset-normalizerがインストールされている場合はそちらを優先し、
+    ない場合は純Python実装のchardetにフォールバックします。
+
+    Args:
+        content: エンコーディングを検出するバイナリデータ
+
+    Returns:
+        (検出されたエンコーディング（不明の場合はNone）, 信頼度)のタプル
+    """
+    if _normalizer_from_bytes is not None:
+        # 候補をサポート対象のコーデックに絞り、サンプルも先頭64KBに制限して
+        # 無関係なコードページとの比較と全文走査のコストを省く
+        best = _normalizer_from_bytes(
+            content[:65536],
+            cp_isolation=["utf_8", "shift_jis", "euc_jp", "iso2022_jp", "ascii"],
+        ).best()
+        if best is None:
+            return None, 0.0
+        return best.encoding, 1.0 - best.chaos
+
+    detector = _shared_detector()
+    detector.feed(content)
+    detector.close()
+    result = detector.result or {}
+    return result.get("encoding"), result.get("confidence") or 0.0
+
+
+def detect_encoding_streaming(
+    file_path: str, fallback: str = "utf-8", sniff_bytes: int = 65536
+) -> tuple[str, float]:
+    """
+    ファイルのエンコーディングをチャンク読み込みで検出します。
+
+    ファイル全体を読み込む代わりにUniversalDetectorへチャンクを順次供給し、
+    検出が確定するか、sniff_bytesに達した時点で読み込みを打ち切ります。
+    大きなファイルでも検出にかかる処理とメモリが先頭部分に限定されます。
+
+    Args:
+        file_path: エンコーディングを検出するファイルのパス
+        fallback: 検出に失敗した場合のフォールバックエンコーディング
+        sniff_bytes: 検出に使用する最大バイト数
+
+    Returns:
+        (検出されたエンコーディング, 信頼度)のタプル
+    """
+    detector = _shared_detector()
+    total = 0
+    all_ascii = True
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(8192), b""):
+            if total == 0:
+                bom_encoding = _detect_bom(chunk)
+                if bom_encoding is not None:
+                    return bom_encoding, 1.0
+            detector.feed(chunk)
+            total += len(chunk)
+            if all_ascii and not chunk.isascii():
+                all_ascii = False
+            if detector.done or total >= sniff_bytes:
+                break
+    detector.close()
+
+    if total == 0:
+        return fallback, 1.0
+
+    if all_ascii:
         return "ascii", 1.0
 
-    result = chardet.detect(content) or {}
-    encoding = result.get("encoding", fallback)
-    confidence = result.get("confidence", 0.0)
+    result = detector.result or {}
+    encoding = result.get("encoding")
+    confidence = result.get("confidence") or 0.0
 
     if encoding is None:
         return fallback, 0.0
@@ -85,14 +278,30 @@ def detect_encoding(content: bytes, fallback: str = "utf-8") -> tuple[str, float
     return normalized, confidence
 
 
+# bytesを渡した場合は失敗時もbytesが返るため、戻り値の型を狭められる
+@overload
 def convert_encoding(
     content: bytes, from_encoding: str, to_encoding: str
-) -> tuple[bytes, bool]:
+) -> tuple[bytes, bool]: ...
+
+
+@overload
+def convert_encoding(
+    content: mmap.mmap, from_encoding: str, to_encoding: str
+) -> "tuple[bytes | mmap.mmap, bool]": ...
+
+
+def convert_encoding(
+    content: "bytes | mmap.mmap", from_encoding: str, to_encoding: str
+) -> "tuple[bytes | mmap.mmap, bool]":
     """
     コンテンツのエンコーディングを変換します。
 
+    bytesのほかmmapオブジェクトも受け付けます。mmapを渡した場合、
+    デコードはマッピングから直接行われるため中間のbytesコピーが発生しません。
+
     Args:
-        content: 変換するバイナリデータ
+        content: 変換するバイナリデータ（bytesまたは読み込み用mmap）
         from_encoding: 元のエンコーディング
         to_encoding: 変換先のエンコーディング
 
@@ -102,19 +311,74 @@ def convert_encoding(
     if from_encoding == to_encoding:
         return content, True
 
+    # 両エンコーディングがASCII互換で内容が純ASCIIなら、バイト表現は
+    # 同一なのでデコード・再エンコードの往復を丸ごと省略できる
+    if (
+        from_encoding in _ASCII_COMPATIBLE
+        and to_encoding in _ASCII_COMPATIBLE
+        and isinstance(content, bytes)
+        and content.isascii()
+    ):
+        return content, True
+
     if from_encoding == "ascii":
         from_encoding = "utf-8"  # ASCIIはUTF-8のサブセットとして扱う
     if to_encoding == "ascii":
         to_encoding = "utf-8"  # ASCIIへの変換はUTF-8への変換として扱う
 
     try:
-        text = content.decode(from_encoding)
-        result = text.encode(to_encoding)
+        text = _codec_info(from_encoding).decode(content)[0]
+        result = _codec_info(to_encoding).encode(text)[0]
         return result, True
     except (UnicodeDecodeError, UnicodeEncodeError):
         return content, False
 
 
+def convert_encoding_streaming(
+    src_fp: BinaryIO, dst_fp: BinaryIO, from_encoding: str, to_encoding: str
+) -> bool:
+    """
+    ファイルオブジェクト間でエンコーディングをストリーミング変換します。
+
+    インクリメンタルコーデックでチャンク単位にデコード・エンコードするため、
+    ファイルサイズに関わらずワーキングセットがチャンクサイズに収まります。
+    巨大なファイルをconvert_encodingで一括変換するとピークメモリが
+    入力の数倍になるのを避けられます。
+
+    Args:
+        src_fp: 変換元のバイナリファイルオブジェクト
+        dst_fp: 変換先のバイナリファイルオブジェクト
+        from_encoding: 元のエンコーディング
+        to_encoding: 変換先のエンコーディング
+
+    Returns:
+        変換に成功した場合はTrue、そうでない場合はFalse
+        （失敗時はdst_fpに途中まで書き込まれている可能性があります）
+    """
+    if from_encoding == "ascii":
+        from_encoding = "utf-8"  # ASCIIはUTF-8のサブセットとして扱う
+    if to_encoding == "ascii":
+        to_encoding = "utf-8"  # ASCIIへの変換はUTF-8への変換として扱う
+
+    # キャッシュ済みのCodecInfoからクラスを取り出し、名前解決を毎回行わない
+    decoder = _codec_info(from_encoding).incrementaldecoder()
+    encoder = _codec_info(to_encoding).incrementalencoder()
+
+    try:
+        while True:
+            chunk = src_fp.read(_STREAM_CHUNK_SIZE)
+            final = not chunk
+            text = decoder.decode(chunk, final)
+            if text or final:
+                # 最終チャンクではエンコーダーのフラッシュも必要
+                # （ISO-2022-JPの終端エスケープシーケンスなど）
+                dst_fp.write(encoder.encode(text, final))
+            if final:
+                return True
+    except (UnicodeDecodeError, UnicodeEncodeError):
+        return False
+
+
 def get_supported_encodings() -> list[str]:
     """
     サポートされているエンコーディングのリストを返します。
@@ -6,36 +6,141 @@
 """
 
 import fnmatch
+import functools
 import os
 import re
-import shutil
+import stat
 
+# タブ・改行・復帰以外の制御文字（テキスト判定で「非テキスト」とみなすバイト）
+_CONTROL_BYTES = bytes(b for b in range(32) if b not in (9, 10, 13))
 
-def is_text_file(file_path: str, max_size: int | None = None) -> bool:
+_SIZE_RE = re.compile(r"^(\d+)([KMG])?$")
+
+
+class ExcludeMatcher:
+    """
+    除外パターンを事前コンパイルして保持するマッチャー
+
+    fnmatch.fnmatchはパターンを呼び出しごとに正規表現へ変換するため、
+    大量のファイルに対して同じパターンリストを繰り返し適用するとコンパイルが
+    ボトルネックになります。このクラスはパターン全体を1つの正規表現に
+    まとめて一度だけコンパイルします。
+    """
+
+    def __init__(self, patterns: list[str] | None):
+        """
+        マッチャーを初期化します。
+
+        Args:
+            patterns: 除外パターンのリスト
+        """
+        self.patterns = list(patterns or [])
+        # ワイルドカードを含まないパターンはセット照合で済み、正規表現が不要
+        literals = []
+        wildcards = []
+        for pattern in self.patterns:
+            if any(c in pattern for c in "*?["):
+                wildcards.append(pattern)
+            else:
+                literals.append(pattern)
+        self._literals = frozenset(literals)
+        if wildcards:
+            self._regex: re.Pattern[str] | None = re.compile(
+                "|".join(fnmatch.translate(p) for p in wildcards)
+            )
+        else:
+            self._regex = None
+        # 同じパスは監視ループで繰り返し判定されるため結果をインスタンスごとにキャッシュ
+        self._match_cached = functools.lru_cache(maxsize=4096)(self._match_uncached)
+
+    def matches(self, path: str) -> bool:
+        """
+        パスが除外パターンに一致するかどうかを判断します。
+
+        結果はパスごとにキャッシュされます。
+
+        Args:
+            path: 判断するパス
+
+        Returns:
+            除外する場合はTrue、そうでない場合はFalse
+        """
+        if not self.patterns:
+            return False
+        return self._match_cached(path)
+
+    def _match_uncached(self, path: str) -> bool:
+        """
+        パスを実際にパターンと照合します。
+
+        Args:
+            path: 判断するパス
+
+        Returns:
+            除外する場合はTrue、そうでない場合はFalse
+        """
+        if path in self._literals:
+            return True
+        if self._regex is not None and self._regex.match(path):
+            return True
+        if os.sep not in path:
+            return False
+        for part in path.split(os.sep):
+            if part in self._literals:
+                return True
+            if self._regex is not None and self._regex.match(part):
+                return True
+        return False
+
+
+@functools.lru_cache(maxsize=32)
+def _get_matcher(patterns: tuple[str, ...]) -> ExcludeMatcher:
+    """
+    パターンのタプルに対応するコンパイル済みマッチャーを返します。
+
+    Args:
+        patterns: 除外パターンのタプル
+
+    Returns:
+        コンパイル済みのExcludeMatcher
+    """
+    return ExcludeMatcher(list(patterns))
+
+
+def is_text_file(
+    file_path: str, max_size: int | None = None, entry: os.DirEntry[str] | None = None
+) -> bool:
     """
     ファイルがテキストファイルかどうかを判断します。
 
     Args:
         file_path: 判断するファイルのパス
         max_size: 処理する最大ファイルサイズ（バイト単位）
+        entry: ファイルに対応するDirEntry（指定時はキャッシュされたstatを利用）
 
     Returns:
         テキストファイルの場合はTrue、そうでない場合はFalse
     """
-    if not os.path.isfile(file_path):
-        return False
-
-    if max_size is not None:
-        file_size = os.path.getsize(file_path)
-        if file_size > max_size:
+    if entry is not None:
+        if not entry.is_file(follow_symlinks=False):
+            return False
+        if max_size is not None and entry.stat(follow_symlinks=False).st_size > max_size:
+            return False
+    else:
+        if not os.path.isfile(file_path):
             return False
 
+        if max_size is not None:
+            file_size = os.path.getsize(file_path)
+            if file_size > max_size:
+                return False
+
     try:
         with open(file_path, "rb") as f:
             chunk = f.read(4096)
             if b"\x00" in chunk:
                 return False
-            control_chars = sum(1 for b in chunk if b < 32 and b not in (9, 10, 13))
+            control_chars = len(chunk) - len(chunk.translate(None, _CONTROL_BYTES))
             if len(chunk) > 0 and control_chars / len(chunk) > 0.3:
                 return False
             return True
@@ -43,10 +148,13 @@ def is_text_file(file_path: str, max_size: int | None = None) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=128)
 def parse_size(size_str: str) -> int:
     """
     サイズ文字列をバイト数に変換します。
 
+    結果は文字列のみから決まる純粋な変換のためキャッシュされます。
+
     Args:
         size_str: サイズ文字列（例: "1M", "500K"）
 
@@ -57,7 +165,7 @@ def parse_size(size_str: str) -> int:
         ValueError: サイズ文字列の形式が無効な場合
     """
     size_str = size_str.upper()
-    match = re.match(r"^(\d+)([KMG])?$", size_str)
+    match = _SIZE_RE.match(size_str)
     if not match:
         raise ValueError(f"Invalid size format: {size_str}")
 
@@ -88,16 +196,7 @@ def should_exclude(path: str, exclude_patterns: list[str]) -> bool:
     if not exclude_patterns:
         return False
 
-    path_parts = path.split(os.sep)
-    for pattern in exclude_patterns:
-        if fnmatch.fnmatch(path, pattern):
-            return True
-        for part in path_parts:
-            if fnmatch.fnmatch(part, pattern):
-                return True
-        if os.path.basename(path) == pattern or pattern in path.split(os.sep):
-            return True
-    return False
+    return _get_matcher(tuple(exclude_patterns)).matches(path)
 
 
 def copy_metadata(src_path: str, dst_path: str) -> None:
@@ -108,13 +207,13 @@ def copy_metadata(src_path: str, dst_path: str) -> None:
         src_path: ソースファイルのパス
         dst_path: 宛先ファイルのパス
     """
-    shutil.copymode(src_path, dst_path)
-
     src_stat = os.stat(src_path)
-    os.utime(dst_path, (src_stat.st_atime, src_stat.st_mtime))
+    os.chmod(dst_path, stat.S_IMODE(src_stat.st_mode))
+    # float秒だと丸めでソースよりわずかに古くなり、mtimeスキップ判定を狂わせる
+    os.utime(dst_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
 
     try:
-        shutil.chown(dst_path, os.stat(src_path).st_uid, os.stat(src_path).st_gid)
+        os.chown(dst_path, src_stat.st_uid, src_stat.st_gid)
     except (OSError, AttributeError):
         pass
 
@@ -124,16 +223,17 @@ def handle_symlink(src_link: str, dst_link: str, src_base: str, dst_base: str) -
     シンボリックリンクを適切に処理します。
 
     Args:
-        src_link: ソースリンクのパス
+        src_link: ソースリンクのパス（絶対パス）
         dst_link: 宛先リンクのパス
-        src_base: ソースディレクトリのベースパス
-        dst_base: 宛先ディレクトリのベースパス
+        src_base: ソースディレクトリのベースパス（正規化済みの絶対パス）
+        dst_base: 宛先ディレクトリのベースパス（正規化済みの絶対パス）
     """
     link_target = os.readlink(src_link)
-    abs_link_target = os.path.abspath(os.path.join(os.path.dirname(src_link), link_target))
+    # src_linkは絶対パスなのでnormpathで十分（abspathのgetcwd呼び出しを回避）
+    abs_link_target = os.path.normpath(os.path.join(os.path.dirname(src_link), link_target))
 
-    if abs_link_target.startswith(os.path.abspath(src_base)):
-        rel_path = os.path.relpath(abs_link_target, os.path.abspath(src_base))
+    if abs_link_target.startswith(src_base):
+        rel_path = os.path.relpath(abs_link_target, src_base)
         new_target = os.path.join(dst_base, rel_path)
         new_target = os.path.relpath(new_target, os.path.dirname(dst_link))
         os.symlink(new_target, dst_link)
@@ -5,16 +5,105 @@
 自動的にエンコーディング変換を行うための機能を提供します。
 """
 
+import hashlib
+import json
 import logging
 import os
 import signal
+import stat
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from charcle.converter import Converter
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+from charcle.converter import MANIFEST_NAME, Converter
+from charcle.utils.bloom import CountingBloomFilter
 from charcle.utils.encoding import detect_encoding
-from charcle.utils.filesystem import should_exclude
+
+# デバウンスの静止ウィンドウ（秒）。エディタの保存は1回の論理的な保存で
+# create/modify/closeのイベントを複数発生させるため、同じファイルへの
+# イベントはこの時間変更が止まるまでまとめてから1回だけ処理する。
+# truncate→writeの途中でファイルを読んでしまう競合の回避も兼ねる。
+_DEBOUNCE_WINDOW = 0.15
+
+# 書き戻し時のエンコーディング検出に使う先頭バイト数。検出器はこの程度の
+# サンプルで収束するため、ファイル全体を読み込む必要はない。
+_ENC_SNIFF_BYTES = 65536
+
+# エンコーディング検出結果キャッシュの最大エントリ数
+_ENC_CACHE_MAX = 4096
+
+# mtime比較で同時刻とみなす許容差（ナノ秒）
+_MTIME_SLOP_NS = 1_000_000
+
+
+class _TreeEventHandler(FileSystemEventHandler):
+    """
+    監視対象ツリーのファイルシステムイベントをWatcherへ振り分けるハンドラ
+    """
+
+    def __init__(self, watcher: "Watcher", prefix: str):
+        """
+        ハンドラを初期化します。
+
+        Args:
+            watcher: イベントの通知先のウォッチャー
+            prefix: 監視対象ツリーのプレフィックス（"src"または"dst"）
+        """
+        self.watcher = watcher
+        self.prefix = prefix
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """
+        作成イベントを処理します。
+
+        Args:
+            event: ファイルシステムイベント
+        """
+        if not event.is_directory:
+            self.watcher._dispatch_event(self.prefix, str(event.src_path), deleted=False)
+
+    def on_modified(self, event: FileSystemEvent) -> None:
+        """
+        変更イベントを処理します。
+
+        Args:
+            event: ファイルシステムイベント
+        """
+        if not event.is_directory:
+            self.watcher._dispatch_event(self.prefix, str(event.src_path), deleted=False)
+
+    def on_deleted(self, event: FileSystemEvent) -> None:
+        """
+        削除イベントを処理します。
+
+        Args:
+            event: ファイルシステムイベント
+        """
+        if not event.is_directory:
+            self.watcher._dispatch_event(self.prefix, str(event.src_path), deleted=True)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """
+        移動イベントを処理します。
+
+        エディタの「一時ファイルに書いてからrenameで置き換える」保存方式では
+        変更がmodifiedではなくmovedとして届くため、移動元の削除と移動先の
+        変更として扱います。
+
+        Args:
+            event: ファイルシステムイベント
+        """
+        if not event.is_directory:
+            self.watcher._dispatch_event(self.prefix, str(event.src_path), deleted=True)
+            if event.dest_path:
+                self.watcher._dispatch_event(
+                    self.prefix, str(event.dest_path), deleted=False
+                )
 
 
 class Watcher:
@@ -49,56 +138,217 @@ class Watcher:
         dst_dir: str,
         converter: Converter,
         interval: float = 1.0,
+        use_polling: bool = False,
+        watch_dst: bool = True,
     ):
         """
         ウォッチャーを初期化します。
 
+        通常はOSのファイル変更通知（inotify/FSEventsなど）を利用し、
+        変更されたファイルの分だけ処理を行います。use_pollingがTrueの場合は
+        従来どおりinterval秒ごとにツリー全体をスキャンします
+        （ネットワークファイルシステムなど通知が届かない環境向け）。
+
         Args:
             src_dir: 監視するソースディレクトリのパス
             dst_dir: 変換先の宛先ディレクトリのパス
             converter: 使用するコンバーターインスタンス
-            interval: 監視間隔（秒）
+            interval: ポーリング時の監視間隔（秒）
+            use_polling: OSのイベント通知を使わずポーリングで監視するかどうか
+            watch_dst: 宛先ディレクトリも監視して書き戻しを行うかどうか
+                （Falseの場合は宛先ツリーの走査・監視を丸ごと省略できる）
         """
         self.src_dir = os.path.abspath(src_dir)
         self.dst_dir = os.path.abspath(dst_dir)
         self.converter = converter
         self.interval = interval
-        self.running = False
+        self.use_polling = use_polling
+        self.watch_dst = watch_dst
+        # 停止要求フラグ。boolのポーリングと違い、待機中のループを即座に起こせる
+        self._stop_event = threading.Event()
+        self._stop_event.set()  # 初期状態は停止
         self.thread: threading.Thread | None = None
-        self.file_mtimes: dict[str, float] = {}
-        self.fallback_files: set[str] = set()  # fallback_charsetで作成されたファイルを追跡
+        # mtimeはst_mtime_ns（整数ナノ秒）で保持する。浮動小数点より比較が速く、
+        # 丸めによる更新の取りこぼしも起きない。
+        self.file_mtimes: dict[str, int] = {}
+        # fallback_charsetで作成されたファイルを追跡。パスのsetはツリーの規模に
+        # 比例して育つため、固定サイズのカウンティングブルームフィルタで持つ。
+        # 偽陽性があり得るため、ヒットはエンコーディング検出を省略する根拠には
+        # せず、検出が確定しない場合の補完としてのみ扱う（_detect_source_encoding）。
+        self.fallback_files = CountingBloomFilter()
+        # コンバーターのコンパイル済みマッチャーをホットパスで直接使う
+        self._exclude_matcher = converter.exclude_matcher
         self.logger = logging.getLogger("charcle")
         self._initial_scan_complete = False
+        self._observer: Any | None = None
+        self._dispatch_lock = threading.Lock()
+        # 書き戻し用コンバーターのプール（キー: (変換元, 変換先)のエンコーディング）
+        self._reverse_converters: dict[tuple[str, str], Converter] = {}
+        # ソースファイルごとの検出結果キャッシュ（キー: パス、値: (mtime_ns, サイズ, 結果)）
+        self._enc_cache: OrderedDict[str, tuple[int, int, str | None]] = OrderedDict()
+        # デバウンス待ちの変更イベント（キー: (prefix, rel_path)、値: 最終イベント時刻）
+        self._pending: dict[tuple[str, str], float] = {}
+        self._pending_lock = threading.Lock()
+        self._pending_event = threading.Event()
+        self._debounce_thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """
+        監視が動作中かどうかを返します。
+
+        Returns:
+            動作中の場合はTrue、そうでない場合はFalse
+        """
+        return not self._stop_event.is_set()
 
-    def start(self) -> None:
+    def start(self, install_signal_handlers: bool = True) -> None:
         """
         監視を開始します。
+
+        Args:
+            install_signal_handlers: SIGINT/SIGTERMのハンドラを登録するかどうか。
+                signal.signalはメインスレッドからしか呼べず、プロセス全体で
+                ハンドラを上書きするため、複数のウォッチャーを併用する場合や
+                ワーカースレッドから起動する場合はFalseを指定し、呼び出し側で
+                stop()を呼んでください。
         """
         if self.running:
             return
 
-        self.running = True
-        self.thread = threading.Thread(target=self._watch_loop)
-        self.thread.daemon = True
-        self.thread.start()
-
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        self._stop_event.clear()
+        if self.use_polling:
+            self.thread = threading.Thread(target=self._watch_loop)
+            self.thread.daemon = True
+            self.thread.start()
+        else:
+            self._start_observer()
+            self._debounce_thread = threading.Thread(target=self._debounce_loop)
+            self._debounce_thread.daemon = True
+            self._debounce_thread.start()
+            self._initial_scan_complete = True
+
+        if install_signal_handlers:
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
 
         self.logger.info(
-            f"Watching {self.src_dir} and {self.dst_dir} for changes "
-            f"(interval: {self.interval}s)"
+            "Watching %s and %s for changes (interval: %ss)",
+            self.src_dir, self.dst_dir, self.interval
         )
 
     def stop(self) -> None:
         """
         監視を停止します。
         """
-        self.running = False
+        self._stop_event.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._debounce_thread is not None:
+            self._pending_event.set()  # 待機中のワーカーを起こして終了させる
+            self._debounce_thread.join()
+            self._debounce_thread = None
         if self.thread:
             self.thread.join()
+        if self.use_polling and self._initial_scan_complete:
+            self._save_mtime_cache()
         self.logger.info("Watching stopped")
 
+    def _start_observer(self) -> None:
+        """
+        OSのファイル変更通知による監視を開始します。
+        """
+        os.makedirs(self.dst_dir, exist_ok=True)
+        self._observer = Observer()
+        self._observer.schedule(_TreeEventHandler(self, "src"), self.src_dir, recursive=True)
+        if self.watch_dst:
+            self._observer.schedule(
+                _TreeEventHandler(self, "dst"), self.dst_dir, recursive=True
+            )
+        self._observer.start()
+
+    def _dispatch_event(self, prefix: str, path: str, deleted: bool) -> None:
+        """
+        ファイルシステムイベントを対応するハンドラへ振り分けます。
+
+        Args:
+            prefix: イベントの発生したツリー（"src"または"dst"）
+            path: イベントの対象ファイルの絶対パス
+            deleted: 削除イベントかどうか
+        """
+        base_dir = self.src_dir if prefix == "src" else self.dst_dir
+        # 監視対象ツリー配下の絶対パスと分かっているので、relpathの
+        # 両引数を分解する正規化コストをかけずプレフィックスを剥がすだけでよい
+        if path.startswith(base_dir + os.sep):
+            rel_path = path[len(base_dir) + 1:]
+        else:
+            rel_path = os.path.relpath(path, base_dir)
+
+        if prefix == "dst" and rel_path == MANIFEST_NAME:
+            return  # 変換マニフェストは同期対象外
+        if self._is_temp_editor_file(os.path.basename(rel_path)):
+            self.logger.debug("Skipping temporary editor file: %s", rel_path)
+            return
+        if self._exclude_matcher.matches(rel_path):
+            self.logger.debug("Skipping excluded file: %s", rel_path)
+            return
+
+        if deleted:
+            # 削除は即時処理し、同じファイルのデバウンス待ちは取り下げる
+            with self._pending_lock:
+                self._pending.pop((prefix, rel_path), None)
+            self._process_change(prefix, rel_path, deleted=True)
+        else:
+            with self._pending_lock:
+                self._pending[(prefix, rel_path)] = time.monotonic()
+            self._pending_event.set()
+
+    def _debounce_loop(self) -> None:
+        """
+        デバウンスワーカーのループ
+
+        変更イベントが_DEBOUNCE_WINDOWの間止まったファイルだけを処理します。
+        """
+        while not self._stop_event.is_set():
+            if not self._pending_event.wait(timeout=0.5):
+                continue
+            time.sleep(_DEBOUNCE_WINDOW)
+
+            now = time.monotonic()
+            due: list[tuple[str, str]] = []
+            with self._pending_lock:
+                for key, timestamp in list(self._pending.items()):
+                    if now - timestamp >= _DEBOUNCE_WINDOW:
+                        del self._pending[key]
+                        due.append(key)
+                if not self._pending:
+                    self._pending_event.clear()
+
+            for prefix, rel_path in due:
+                self._process_change(prefix, rel_path, deleted=False)
+
+    def _process_change(self, prefix: str, rel_path: str, deleted: bool) -> None:
+        """
+        単一の変更イベントを対応するハンドラで処理します。
+
+        Args:
+            prefix: イベントの発生したツリー（"src"または"dst"）
+            rel_path: 対象ファイルの相対パス
+            deleted: 削除イベントかどうか
+        """
+        with self._dispatch_lock:
+            try:
+                if deleted:
+                    self._handle_deleted_file(prefix, rel_path)
+                elif prefix == "src":
+                    self._handle_source_change(rel_path)
+                else:
+                    self._handle_destination_change(rel_path)
+            except Exception as e:
+                self.logger.error("Error handling event for %s: %s", rel_path, e)
+
     def is_scan_complete(self) -> bool:
         """
         初期スキャンが完了したかどうかを返します。
@@ -116,29 +366,117 @@ class Watcher:
             signum: シグナル番号
             frame: 現在のスタックフレーム
         """
-        self.logger.info(f"Received signal {signum}, stopping...")
+        self.logger.info("Received signal %s, stopping...", signum)
         self.stop()
 
     def _watch_loop(self) -> None:
         """
         監視ループ
         """
+        if self._load_mtime_cache():
+            # 前回終了時のスキャン結果を再利用できるため、起動時のstatの嵐を省略
+            # できる。前回終了後の変更は最初のtickで通常の差分として検出される。
+            self.logger.info("Loaded mtime cache, skipping initial scan")
+            self._initial_scan_complete = True
+            self._poll_loop()
+            return
+
         self.logger.info("Initial scan of files")
-        self._scan_files(self.src_dir, self.file_mtimes, "src")
-        self._scan_files(self.dst_dir, self.file_mtimes, "dst")
-        self.logger.debug(f"Initial files: {list(self.file_mtimes.keys())}")
+        if self.watch_dst:
+            # 2つのツリーの走査は独立したstat主体のI/Oなので並行に実行する。
+            # 書き込み競合を避けるため、それぞれ専用の辞書に書いてから統合する。
+            src_mtimes: dict[str, int] = {}
+            dst_mtimes: dict[str, int] = {}
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                src_future = executor.submit(
+                    self._scan_files, self.src_dir, src_mtimes, "src"
+                )
+                dst_future = executor.submit(
+                    self._scan_files, self.dst_dir, dst_mtimes, "dst"
+                )
+                src_future.result()
+                dst_future.result()
+            self.file_mtimes.update(src_mtimes)
+            self.file_mtimes.update(dst_mtimes)
+        else:
+            self._scan_files(self.src_dir, self.file_mtimes, "src")
+        self.logger.debug("Initial files: %s", list(self.file_mtimes.keys()))
         self._initial_scan_complete = True
+        self._poll_loop()
 
-        while self.running:
+    def _poll_loop(self) -> None:
+        """
+        ポーリングの本体ループ
+        """
+        while not self._stop_event.is_set():
             try:
                 self.logger.debug("Processing changes...")
                 self._process_changes()
-                time.sleep(self.interval)
+                # stop()が呼ばれたら次のtickを待たずに即座に抜ける
+                self._stop_event.wait(self.interval)
             except Exception as e:
-                self.logger.error(f"Error in watch loop: {str(e)}")
-                time.sleep(self.interval)
+                self.logger.error("Error in watch loop: %s", e)
+                self._stop_event.wait(self.interval)
+
+    def _mtime_cache_path(self) -> str:
+        """
+        mtimeキャッシュの保存先パスを返します。
+
+        キーには監視対象のパスに加えてwatch_dstと除外パターンも含めます。
+        スキャン範囲の異なる設定で同じキャッシュを共有すると、新しい設定では
+        走査されないキーがすべて削除として扱われ、削除の伝播で両ツリーの
+        ファイルを消してしまうためです。
 
-    def _scan_files(self, directory: str, mtimes: dict[str, float], prefix: str) -> None:
+        Returns:
+            監視対象ディレクトリとスキャン設定の組に対応するキャッシュファイルのパス
+        """
+        config = "\0".join(
+            [self.src_dir, self.dst_dir, f"watch_dst={self.watch_dst}"]
+            + sorted(self.converter.exclude_patterns)
+        )
+        digest = hashlib.sha1(config.encode()).hexdigest()
+        return os.path.join(
+            os.path.expanduser("~"), ".cache", "charcle", f"{digest}.json"
+        )
+
+    def _load_mtime_cache(self) -> bool:
+        """
+        前回の監視終了時に保存したmtimeマップを読み込みます。
+
+        Returns:
+            キャッシュを読み込めた場合はTrue、そうでない場合はFalse
+        """
+        try:
+            with open(self._mtime_cache_path(), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or not data:
+            return False
+        try:
+            self.file_mtimes = {str(key): int(value) for key, value in data.items()}
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    def _save_mtime_cache(self) -> None:
+        """
+        現在のmtimeマップをディスクへ保存します。
+
+        次回起動時の初期スキャンを省略するためのもので、保存に失敗しても
+        監視の動作には影響しません。書き込みはos.replaceでアトミックに行います。
+        """
+        path = self._mtime_cache_path()
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.file_mtimes, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug("Failed to save mtime cache: %s", e)
+
+    def _scan_files(self, directory: str, mtimes: dict[str, int], prefix: str) -> None:
         """
         ディレクトリ内のファイルのmtimeをスキャンします。
 
@@ -156,28 +494,56 @@ class Watcher:
         if not os.path.exists(directory):
             return
 
-        for root, _, files in os.walk(directory):
-            rel_dir = os.path.relpath(root, directory)
-            if rel_dir != "." and should_exclude(rel_dir, self.converter.exclude_patterns):
-                continue
+        stack: list[tuple[str, str]] = [(directory, "")]
+        while stack:
+            abs_dir, rel_dir = stack.pop()
+            try:
+                entries = list(os.scandir(abs_dir))
+            except OSError:
+                continue  # ディレクトリにアクセスできない場合はスキップ
 
-            for file in files:
-                file_path = os.path.join(root, file)
-                if os.path.islink(file_path):
-                    continue  # シンボリックリンクはスキップ
-                if self._is_temp_editor_file(file):
-                    self.logger.debug(f"Skipping temporary editor file: {file}")
-                    continue  # 一時的なエディタファイルはスキップ
+            for entry in entries:
+                # ホットループなのでos.path.joinではなく文字列連結で組み立てる
+                rel_path = f"{rel_dir}{os.sep}{entry.name}" if rel_dir else entry.name
                 try:
-                    rel_path = os.path.relpath(file_path, directory)
-                    if should_exclude(rel_path, self.converter.exclude_patterns):
-                        self.logger.debug(f"Skipping excluded file: {rel_path}")
-                        continue
-                    key = f"{prefix}:{rel_path}"
-                    mtimes[key] = os.path.getmtime(file_path)
+                    self._scan_entry(entry, rel_path, stack, mtimes, prefix)
                 except OSError:
                     pass  # ファイルにアクセスできない場合はスキップ
 
+    def _scan_entry(
+        self,
+        entry: os.DirEntry[str],
+        rel_path: str,
+        stack: list[tuple[str, str]],
+        mtimes: dict[str, int],
+        prefix: str,
+    ) -> None:
+        """
+        スキャン中の単一エントリを処理します。
+
+        Args:
+            entry: 処理するDirEntry
+            rel_path: スキャン対象ディレクトリからの相対パス
+            stack: 未走査ディレクトリのスタック
+            mtimes: mtime情報を格納する辞書
+            prefix: キーのプレフィックス（"src"または"dst"）
+        """
+        if entry.is_symlink():
+            return  # シンボリックリンクはスキップ
+        if entry.is_dir(follow_symlinks=False):
+            if not self._exclude_matcher.matches(rel_path):
+                stack.append((entry.path, rel_path))
+            return
+        if prefix == "dst" and rel_path == MANIFEST_NAME:
+            return  # 変換マニフェストは同期対象外
+        if self._is_temp_editor_file(entry.name):
+            self.logger.debug("Skipping temporary editor file: %s", entry.name)
+            return  # 一時的なエディタファイルはスキップ
+        if self._exclude_matcher.matches(rel_path):
+            self.logger.debug("Skipping excluded file: %s", rel_path)
+            return
+        mtimes[f"{prefix}:{rel_path}"] = entry.stat(follow_symlinks=False).st_mtime_ns
+
     def _handle_source_change(self, rel_path: str) -> None:
         """
         ソースファイルの変更を処理します。
@@ -187,22 +553,23 @@ class Watcher:
         """
         src_file = os.path.join(self.src_dir, rel_path)
         dst_file = os.path.join(self.dst_dir, rel_path)
-        dst_dir = os.path.dirname(dst_file)
-        if not os.path.exists(dst_dir):
-            os.makedirs(dst_dir)
-        self.logger.info(f"Source file changed: {rel_path}")
+        os.makedirs(os.path.dirname(dst_file), exist_ok=True)
+        self.logger.info("Source file changed: %s", rel_path)
         try:
             self.converter.convert_file(src_file, dst_file)
         except Exception as e:
-            self.logger.error(f"Error converting {rel_path}: {str(e)}")
+            self.logger.error("Error converting %s: %s", rel_path, e)
 
-    def _determine_encoding(self, src_file: str, rel_path: str) -> str | None:
+    def _determine_encoding(
+        self, src_file: str, rel_path: str, src_stat: "os.stat_result | None"
+    ) -> str | None:
         """
         ソースファイルのエンコーディングを決定します。
 
         Args:
             src_file: ソースファイルのパス
             rel_path: ファイルの相対パス
+            src_stat: 呼び出し側で取得済みのstat結果（存在しない場合はNone）
 
         Returns:
             決定されたエンコーディング
@@ -210,40 +577,93 @@ class Watcher:
         to_encoding = self.converter.from_encoding
         is_fallback_file = rel_path in self.fallback_files
 
-        if not os.path.exists(src_file):
+        if src_stat is None:
             if self.converter.fallback_charset:
                 to_encoding = self.converter.fallback_charset
                 self.fallback_files.add(rel_path)
-                self.logger.info(f"Using fallback charset for new file: {to_encoding}")
+                self.logger.info("Using fallback charset for new file: %s", to_encoding)
             return to_encoding
 
-        if is_fallback_file and self.converter.fallback_charset:
-            to_encoding = self.converter.fallback_charset
-            self.logger.info(f"Using fallback charset for existing file: {to_encoding}")
-            return to_encoding
+        if stat.S_ISREG(src_stat.st_mode):
+            to_encoding = self._detect_source_encoding(
+                src_file, rel_path, is_fallback_file, to_encoding, src_stat
+            )
 
-        if os.path.isfile(src_file):
-            try:
-                with open(src_file, "rb") as f:
-                    content = f.read()
-                is_ascii_only = all(b <= 127 for b in content)
-                if is_ascii_only and is_fallback_file and self.converter.fallback_charset:
+        return to_encoding
+
+    def _detect_source_encoding(
+        self,
+        src_file: str,
+        rel_path: str,
+        is_fallback_file: bool,
+        to_encoding: str | None,
+        src_stat: os.stat_result,
+    ) -> str | None:
+        """
+        ソースファイルの内容からエンコーディングを検出します。
+
+        Args:
+            src_file: ソースファイルのパス
+            rel_path: ファイルの相対パス
+            is_fallback_file: fallback_charsetで作成されたファイルかどうか
+            to_encoding: 検出できなかった場合に返すエンコーディング
+            src_stat: 呼び出し側で取得済みのstat結果（キャッシュキーに利用）
+
+        Returns:
+            決定されたエンコーディング
+        """
+        try:
+            # ソースが前回の検出から変わっていなければ再スニッフ不要
+            cached = self._enc_cache.get(src_file)
+            if (
+                cached is not None
+                and cached[0] == src_stat.st_mtime_ns
+                and cached[1] == src_stat.st_size
+            ):
+                self._enc_cache.move_to_end(src_file)
+                return cached[2]
+
+            with open(src_file, "rb") as f:
+                content = f.read(_ENC_SNIFF_BYTES)
+            if content.isascii():
+                if is_fallback_file and self.converter.fallback_charset:
                     to_encoding = self.converter.fallback_charset
                     self.logger.info(
-                        f"File contains only ASCII, using fallback charset: {to_encoding}"
+                        "File contains only ASCII, using fallback charset: %s",
+                        to_encoding,
                     )
                 else:
-                    detected_encoding, confidence = detect_encoding(content)
-                    if confidence >= 0.7:
-                        to_encoding = detected_encoding
-                        if is_fallback_file:
-                            self.fallback_files.remove(rel_path)
-                        self.logger.info(
-                            f"Detected source file encoding: {to_encoding} "
-                            f"(confidence: {confidence:.2f})"
-                        )
-            except Exception as e:
-                self.logger.warning(f"Error detecting source file encoding: {str(e)}")
+                    # ASCIIはサポートする全エンコーディングで同一バイトなので
+                    # 検出器を通すまでもなく確定できる
+                    to_encoding = "ascii"
+                    self.logger.info(
+                        "Detected source file encoding: ascii (confidence: 1.00)"
+                    )
+            else:
+                detected_encoding, confidence = detect_encoding(content)
+                if confidence >= 0.7:
+                    to_encoding = detected_encoding
+                    if is_fallback_file:
+                        self.fallback_files.discard(rel_path)
+                    self.logger.info(
+                        "Detected source file encoding: %s (confidence: %.2f)",
+                        to_encoding, confidence
+                    )
+                elif is_fallback_file and self.converter.fallback_charset:
+                    # ブルームフィルタの偽陽性があり得るため、フォールバックの
+                    # 履歴は確信度の高い検出結果を覆せない補完としてのみ使う
+                    to_encoding = self.converter.fallback_charset
+                    self.logger.info(
+                        "Using fallback charset for existing file: %s", to_encoding
+                    )
+
+            self._enc_cache[src_file] = (
+                src_stat.st_mtime_ns, src_stat.st_size, to_encoding
+            )
+            if len(self._enc_cache) > _ENC_CACHE_MAX:
+                self._enc_cache.popitem(last=False)
+        except Exception as e:
+            self.logger.warning("Error detecting source file encoding: %s", e)
 
         return to_encoding
 
@@ -255,40 +675,71 @@ class Watcher:
             rel_path: 変更されたファイルの相対パス
         """
         # 除外パターンに一致するファイルはスキップ
-        if should_exclude(rel_path, self.converter.exclude_patterns):
-            self.logger.debug(f"Skipping excluded destination file: {rel_path}")
+        if self._exclude_matcher.matches(rel_path):
+            self.logger.debug("Skipping excluded destination file: %s", rel_path)
             return
 
         dst_file = os.path.join(self.dst_dir, rel_path)
         src_file = os.path.join(self.src_dir, rel_path)
-        src_dir = os.path.dirname(src_file)
 
-        if not os.path.exists(dst_file) or not os.path.isfile(dst_file):
+        # exists+isfile+getmtimeの重ね掛けはパスごとに1回のstatへ集約する
+        # （存在確認してから操作するまでの間に消えるTOCTOU競合も消える）
+        try:
+            dst_stat = os.stat(dst_file)
+        except FileNotFoundError:
+            return
+        if not stat.S_ISREG(dst_stat.st_mode):
             return
 
-        if not os.path.exists(src_dir):
-            os.makedirs(src_dir)
+        os.makedirs(os.path.dirname(src_file), exist_ok=True)
 
-        if os.path.exists(src_file):
-            dst_mtime = os.path.getmtime(dst_file)
-            src_mtime = os.path.getmtime(src_file)
-            if dst_mtime <= src_mtime:
-                return
+        try:
+            src_stat: os.stat_result | None = os.stat(src_file)
+        except FileNotFoundError:
+            src_stat = None
+        # ファイルシステムのタイムスタンプ粒度（ext4で1ms程度）以内の差は
+        # 同時刻とみなし、両側をtouchするツールによる書き戻しの空振りを防ぐ
+        if (
+            src_stat is not None
+            and dst_stat.st_mtime_ns <= src_stat.st_mtime_ns + _MTIME_SLOP_NS
+        ):
+            return
 
-        to_encoding = self._determine_encoding(src_file, rel_path)
+        to_encoding = self._determine_encoding(src_file, rel_path, src_stat)
 
-        self.logger.info(f"Destination file changed: {rel_path}, writing back")
-        reverse_converter = Converter(
-            from_encoding=self.converter.to_encoding,
-            to_encoding=to_encoding or "utf-8",
-            max_size=None,  # 既に変換済みのファイルなのでサイズ制限は不要
-            exclude_patterns=self.converter.exclude_patterns,
-            verbose=self.converter.verbose,
-        )
+        self.logger.info("Destination file changed: %s, writing back", rel_path)
+        reverse_converter = self._get_reverse_converter(to_encoding or "utf-8")
         try:
             reverse_converter.convert_file(dst_file, src_file)
         except Exception as e:
-            self.logger.error(f"Error writing back {rel_path}: {str(e)}")
+            self.logger.error("Error writing back %s: %s", rel_path, e)
+
+    def _get_reverse_converter(self, to_encoding: str) -> Converter:
+        """
+        書き戻し用のコンバーターを返します。
+
+        宛先ファイルの変更ごとにコンバーターを構築し直すのは無駄なため、
+        (変換元, 変換先)のペアごとにインスタンスをプールします。
+        除外パターンとverboseはウォッチャーの生存期間中不変なのでキーに含めません。
+
+        Args:
+            to_encoding: 書き戻し先のエンコーディング
+
+        Returns:
+            書き戻し用のコンバーター
+        """
+        key = (self.converter.to_encoding, to_encoding)
+        reverse_converter = self._reverse_converters.get(key)
+        if reverse_converter is None:
+            reverse_converter = Converter(
+                from_encoding=self.converter.to_encoding,
+                to_encoding=to_encoding,
+                max_size=None,  # 既に変換済みのファイルなのでサイズ制限は不要
+                exclude_patterns=self.converter.exclude_patterns,
+                verbose=self.converter.verbose,
+            )
+            self._reverse_converters[key] = reverse_converter
+        return reverse_converter
 
     def _handle_deleted_file(self, prefix: str, rel_path: str) -> None:
         """
@@ -300,59 +751,130 @@ class Watcher:
         """
         # 一時的なエディタファイルはスキップ
         if self._is_temp_editor_file(os.path.basename(rel_path)):
-            self.logger.info(f"Skipping temporary editor file: {rel_path}")
+            self.logger.info("Skipping temporary editor file: %s", rel_path)
             return
 
+        # ソースが消えたら対応する検出結果キャッシュも破棄する
+        self._enc_cache.pop(os.path.join(self.src_dir, rel_path), None)
+
+        # 存在確認せずに削除し、既に消えている場合だけ無視する（stat 1回分の節約）
         if prefix == "src":
             dst_file = os.path.join(self.dst_dir, rel_path)
-            if os.path.exists(dst_file):
-                self.logger.info(f"Source file deleted: {rel_path}, removing destination file")
-                try:
-                    os.remove(dst_file)
-                except OSError as e:
-                    self.logger.error(f"Error removing {dst_file}: {str(e)}")
+            self.converter.discard_manifest_entry(dst_file)
+            try:
+                os.remove(dst_file)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.error("Error removing %s: %s", dst_file, e)
+            else:
+                self.logger.info(
+                    "Source file deleted: %s, removing destination file", rel_path
+                )
         elif prefix == "dst":
             src_file = os.path.join(self.src_dir, rel_path)
-            if os.path.exists(src_file):
-                self.logger.info(f"Destination file deleted: {rel_path}, removing source file")
-                try:
-                    os.remove(src_file)
-                except OSError as e:
-                    self.logger.error(f"Error removing {src_file}: {str(e)}")
+            try:
+                os.remove(src_file)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.error("Error removing %s: %s", src_file, e)
+            else:
+                self.logger.info(
+                    "Destination file deleted: %s, removing source file", rel_path
+                )
 
     def _process_changes(self) -> None:
         """
         変更されたファイルを検出して処理します。
-        """
-        current_mtimes: dict[str, float] = {}
-        self._scan_files(self.src_dir, current_mtimes, "src")
-        self._scan_files(self.dst_dir, current_mtimes, "dst")
 
-        self.logger.debug(f"Current files: {list(current_mtimes.keys())}")
-        self.logger.debug(f"Previous files: {list(self.file_mtimes.keys())}")
+        ツリーを歩きながらself.file_mtimesをその場で更新するため、
+        tickごとに全ファイル分の辞書を作り直してdiffする必要がありません。
+        """
+        seen: set[str] = set()
+        self._scan_tree_incremental(self.src_dir, "src", seen)
+        if self.watch_dst:
+            self._scan_tree_incremental(self.dst_dir, "dst", seen)
 
-        for key, mtime in current_mtimes.items():
+        for key in self.file_mtimes.keys() - seen:
+            del self.file_mtimes[key]
             prefix, rel_path = key.split(":", 1)
-            if key not in self.file_mtimes:
-                self.logger.debug(f"New file detected: {key}")
-                if prefix == "src":
-                    self._handle_source_change(rel_path)
-                elif prefix == "dst":
-                    self._handle_destination_change(rel_path)
-            elif mtime > self.file_mtimes[key]:
-                self.logger.debug(
-                    f"Modified file detected: {key}, "
-                    f"old mtime: {self.file_mtimes[key]}, new mtime: {mtime}"
-                )
-                if prefix == "src":
-                    self._handle_source_change(rel_path)
-                elif prefix == "dst":
-                    self._handle_destination_change(rel_path)
+            self._handle_deleted_file(prefix, rel_path)
 
-        for key in list(self.file_mtimes.keys()):
-            if key not in current_mtimes:
-                prefix, rel_path = key.split(":", 1)
-                self._handle_deleted_file(prefix, rel_path)
-                del self.file_mtimes[key]
+    def _scan_tree_incremental(self, directory: str, prefix: str, seen: set[str]) -> None:
+        """
+        ツリーを走査し、変更のあったファイルをその場で処理します。
 
-        self.file_mtimes = current_mtimes
+        Args:
+            directory: スキャンするディレクトリのパス
+            prefix: キーのプレフィックス（"src"または"dst"）
+            seen: 観測したキーを記録するセット（削除検出用）
+        """
+        if not os.path.exists(directory):
+            return
+
+        stack: list[tuple[str, str]] = [(directory, "")]
+        while stack:
+            abs_dir, rel_dir = stack.pop()
+            try:
+                entries = list(os.scandir(abs_dir))
+            except OSError:
+                continue  # ディレクトリにアクセスできない場合はスキップ
+
+            for entry in entries:
+                rel_path = f"{rel_dir}{os.sep}{entry.name}" if rel_dir else entry.name
+                try:
+                    self._update_entry(entry, rel_path, stack, prefix, seen)
+                except OSError:
+                    pass  # ファイルにアクセスできない場合はスキップ
+
+    def _update_entry(
+        self,
+        entry: os.DirEntry[str],
+        rel_path: str,
+        stack: list[tuple[str, str]],
+        prefix: str,
+        seen: set[str],
+    ) -> None:
+        """
+        スキャン中の単一エントリを処理し、変更があればハンドラを呼び出します。
+
+        Args:
+            entry: 処理するDirEntry
+            rel_path: スキャン対象ディレクトリからの相対パス
+            stack: 未走査ディレクトリのスタック
+            prefix: キーのプレフィックス（"src"または"dst"）
+            seen: 観測したキーを記録するセット
+        """
+        if entry.is_symlink():
+            return  # シンボリックリンクはスキップ
+        if entry.is_dir(follow_symlinks=False):
+            if not self._exclude_matcher.matches(rel_path):
+                stack.append((entry.path, rel_path))
+            return
+        if prefix == "dst" and rel_path == MANIFEST_NAME:
+            return  # 変換マニフェストは同期対象外
+        if self._is_temp_editor_file(entry.name):
+            return  # 一時的なエディタファイルはスキップ
+        if self._exclude_matcher.matches(rel_path):
+            return
+
+        key = f"{prefix}:{rel_path}"
+        seen.add(key)
+        mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+        previous = self.file_mtimes.get(key)
+        if previous is not None and mtime <= previous:
+            return
+
+        self.file_mtimes[key] = mtime
+        if previous is None:
+            self.logger.debug("New file detected: %s", key)
+        else:
+            self.logger.debug(
+                "Modified file detected: %s, old mtime: %s, new mtime: %s",
+                key, previous, mtime
+            )
+        if prefix == "src":
+            self._handle_source_change(rel_path)
+        else:
+            self._handle_destination_change(rel_path)
@@ -0,0 +1,58 @@
+"""
+Bloomモジュールのテスト
+"""
+
+import unittest
+
+from charcle.utils.bloom import CountingBloomFilter
+
+
+class TestCountingBloomFilter(unittest.TestCase):
+    """
+    カウンティングブルームフィルタのテスト
+    """
+
+    def test_add_and_contains(self) -> None:
+        """
+        追加した要素が含まれると判定されるテスト
+        """
+        bloom = CountingBloomFilter()
+        bloom.add("src/a.txt")
+
+        self.assertIn("src/a.txt", bloom)
+        self.assertNotIn("src/b.txt", bloom)
+
+    def test_discard_removes_element(self) -> None:
+        """
+        削除した要素が含まれないと判定されるテスト
+        """
+        bloom = CountingBloomFilter()
+        bloom.add("src/a.txt")
+        bloom.discard("src/a.txt")
+
+        self.assertNotIn("src/a.txt", bloom)
+
+    def test_discard_missing_element_is_noop(self) -> None:
+        """
+        含まれていない要素の削除が他の要素に影響しないテスト
+        """
+        bloom = CountingBloomFilter()
+        bloom.add("src/a.txt")
+        bloom.discard("src/b.txt")
+
+        self.assertIn("src/a.txt", bloom)
+
+    def test_duplicate_add_survives_single_discard(self) -> None:
+        """
+        複数回追加した要素が1回の削除では消えないテスト
+        """
+        bloom = CountingBloomFilter()
+        bloom.add("src/a.txt")
+        bloom.add("src/a.txt")
+        bloom.discard("src/a.txt")
+
+        self.assertIn("src/a.txt", bloom)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,7 +8,6 @@ import sys
 import tempfile
 import unittest
 from io import StringIO
-from typing import Any
 from unittest.mock import patch
 
 from charcle.cli import main
@@ -19,19 +18,38 @@ class TestCLI(unittest.TestCase):
     CLIのテスト
     """
 
+    fixture_dir: str
+    src_dir: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        クラス全体で共有する読み取り専用のソースフィクスチャを作成
+        """
+        cls.fixture_dir = tempfile.mkdtemp()
+        cls.src_dir = os.path.join(cls.fixture_dir, "src")
+        os.makedirs(cls.src_dir)
+
+        test_content = "こんにちは、世界！"
+        with open(os.path.join(cls.src_dir, "test.txt"), "w", encoding="utf-8") as f:
+            f.write(test_content)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        共有フィクスチャのクリーンアップ
+        """
+        shutil.rmtree(cls.fixture_dir)
+
     def setUp(self) -> None:
         """
         テスト前の準備
+
+        ソースはクラス共有のフィクスチャを読み取り専用で使い、
+        書き込み先だけをテストごとに用意します。
         """
         self.test_dir = tempfile.mkdtemp()
-        self.src_dir = os.path.join(self.test_dir, "src")
         self.dst_dir = os.path.join(self.test_dir, "dst")
-        os.makedirs(self.src_dir)
-
-        test_content = "こんにちは、世界！"
-        self.test_file = os.path.join(self.src_dir, "test.txt")
-        with open(self.test_file, "w", encoding="utf-8") as f:
-            f.write(test_content)
 
     def tearDown(self) -> None:
         """
@@ -39,16 +57,15 @@ class TestCLI(unittest.TestCase):
         """
         shutil.rmtree(self.test_dir)
 
-    @patch("sys.argv")
-    def test_list_encodings(self, mock_argv: Any) -> None:
+    def test_list_encodings(self) -> None:
         """
         エンコーディング一覧表示のテスト
         """
-        mock_argv.__getitem__.side_effect = lambda i: ["charcle", "--list"][i]
         captured_output = StringIO()
         sys.stdout = captured_output
         try:
-            main()
+            with patch.object(sys, "argv", ["charcle", "--list"]):
+                main()
             output = captured_output.getvalue()
             self.assertIn("サポートするエンコーディング:", output)
             self.assertIn("utf-8", output)
@@ -56,54 +73,48 @@ class TestCLI(unittest.TestCase):
         finally:
             sys.stdout = sys.__stdout__
 
-    @patch("sys.argv")
-    def test_convert_directory(self, mock_argv: Any) -> None:
+    def test_convert_directory(self) -> None:
         """
         ディレクトリ変換のテスト
         """
-        mock_argv.__getitem__.side_effect = lambda i: ["charcle", self.src_dir, self.dst_dir][i]
-        exit_code = main()
+        with patch.object(sys, "argv", ["charcle", self.src_dir, self.dst_dir]):
+            exit_code = main()
         self.assertEqual(exit_code, 0)
         self.assertTrue(os.path.exists(os.path.join(self.dst_dir, "test.txt")))
 
-    @patch("sys.argv")
-    def test_fallback_charset_option(self, mock_argv: Any) -> None:
+    def test_fallback_charset_option(self) -> None:
         """
         fallback_charsetオプションのテスト
         """
-        mock_argv.__getitem__.side_effect = lambda i: [
+        argv = [
             "charcle",
             "--fallback-charset=euc-jp",
             "--watch",
             self.src_dir,
-            self.dst_dir
-        ][i]
-        with patch("charcle.cli.Watcher") as mock_watcher:
-            with patch("time.sleep", side_effect=KeyboardInterrupt):
-                try:
-                    main()
-                except KeyboardInterrupt:
-                    pass
-            converter = mock_watcher.call_args[1]["converter"]
-            self.assertEqual(converter.fallback_charset, "euc-jp")
+            self.dst_dir,
+        ]
+        with patch.object(sys, "argv", argv):
+            with patch("charcle.cli.Watcher") as mock_watcher:
+                with patch("time.sleep", side_effect=KeyboardInterrupt):
+                    try:
+                        main()
+                    except KeyboardInterrupt:
+                        pass
+                converter = mock_watcher.call_args[1]["converter"]
+                self.assertEqual(converter.fallback_charset, "euc-jp")
 
-    @patch("sys.argv")
-    def test_watch_with_no_destination_directory(self, mock_argv: Any) -> None:
+    def test_watch_with_no_destination_directory(self) -> None:
         """
         宛先ディレクトリが存在しない場合のwatchオプションのテスト
         """
         self.assertFalse(os.path.exists(self.dst_dir))
-        mock_argv.__getitem__.side_effect = lambda i: [
-            "charcle",
-            "--watch",
-            self.src_dir,
-            self.dst_dir
-        ][i]
-        with patch("charcle.cli.Watcher"):
-            with patch("time.sleep", side_effect=KeyboardInterrupt):
-                try:
-                    main()
-                except KeyboardInterrupt:
-                    pass
-            self.assertTrue(os.path.exists(self.dst_dir))
-            self.assertTrue(os.path.exists(os.path.join(self.dst_dir, "test.txt")))
+        argv = ["charcle", "--watch", self.src_dir, self.dst_dir]
+        with patch.object(sys, "argv", argv):
+            with patch("charcle.cli.Watcher"):
+                with patch("time.sleep", side_effect=KeyboardInterrupt):
+                    try:
+                        main()
+                    except KeyboardInterrupt:
+                        pass
+                self.assertTrue(os.path.exists(self.dst_dir))
+                self.assertTrue(os.path.exists(os.path.join(self.dst_dir, "test.txt")))
@@ -2,6 +2,7 @@
 Converterモジュールのテスト
 """
 
+import json
 import os
 import shutil
 import tempfile
@@ -151,3 +152,62 @@ class TestConverter(unittest.TestCase):
         with self.assertLogs(level="INFO") as log:
             converter.convert_file(test_file, os.path.join(self.dst_dir, "test_skip.txt"))
             self.assertIn("Converted", log.output[0])
+
+    def test_parallel_jobs_populate_manifest(self) -> None:
+        """
+        並列変換でもマニフェストにエントリが記録されるかのテスト
+        """
+        names = [f"file_{i}.txt" for i in range(6)]
+        for name in names:
+            with open(os.path.join(self.src_dir, name), "w", encoding="utf-8") as f:
+                f.write("こんにちは、世界！")
+
+        converter = Converter(to_encoding="shift-jis", jobs=2)
+        converter.convert_directory(self.src_dir, self.dst_dir)
+
+        manifest_path = os.path.join(self.dst_dir, ".charcle-cache.json")
+        self.assertTrue(os.path.exists(manifest_path))
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        for name in names:
+            self.assertIn(name, manifest)
+
+    def test_recreates_externally_deleted_destination(self) -> None:
+        """
+        外部で削除された宛先ファイルが再変換で復元されるかのテスト
+
+        マニフェストが一致していても宛先の存在確認を省略してはいけません。
+        """
+        test_file = os.path.join(self.src_dir, "test_deleted.txt")
+        with open(test_file, "w", encoding="utf-8") as f:
+            f.write("こんにちは、世界！")
+
+        converter = Converter(from_encoding="utf-8", to_encoding="utf-8")
+        converter.convert_directory(self.src_dir, self.dst_dir)
+
+        dst_file = os.path.join(self.dst_dir, "test_deleted.txt")
+        self.assertTrue(os.path.exists(dst_file))
+        os.remove(dst_file)
+
+        converter.convert_directory(self.src_dir, self.dst_dir)
+        self.assertTrue(os.path.exists(dst_file))
+
+    def test_prunes_manifest_entries_for_deleted_sources(self) -> None:
+        """
+        削除されたソースのマニフェストエントリが掃除されるかのテスト
+        """
+        for name in ("keep.txt", "remove.txt"):
+            with open(os.path.join(self.src_dir, name), "w", encoding="utf-8") as f:
+                f.write("こんにちは、世界！")
+
+        converter = Converter(from_encoding="utf-8", to_encoding="utf-8")
+        converter.convert_directory(self.src_dir, self.dst_dir)
+
+        os.remove(os.path.join(self.src_dir, "remove.txt"))
+        converter.convert_directory(self.src_dir, self.dst_dir)
+
+        manifest_path = os.path.join(self.dst_dir, ".charcle-cache.json")
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.assertIn("keep.txt", manifest)
+        self.assertNotIn("remove.txt", manifest)
@@ -86,6 +86,45 @@ class TestWatcher(unittest.TestCase):
         finally:
             watcher.stop()
 
+    def test_detection_overrides_stale_fallback_marker(self) -> None:
+        """
+        fallback_filesの偽陽性が既存ファイルの書き戻しを壊さないかのテスト
+
+        カウンティングブルームフィルタは無関係なパスに誤ヒットし得るため、
+        確信度の高い検出結果がフォールバック指定より優先されることを確認します。
+        """
+        test_content = "こんにちは、世界！日本語のテキストです。" * 10
+        src_file = os.path.join(self.src_dir, "test_eucjp.txt")
+        with open(src_file, "wb") as f:
+            f.write(test_content.encode("euc-jp"))
+
+        converter = Converter(to_encoding="utf-8", fallback_charset="shift-jis")
+        converter.convert_directory(self.src_dir, self.dst_dir)
+
+        dst_file = os.path.join(self.dst_dir, "test_eucjp.txt")
+        self.assertTrue(os.path.exists(dst_file))
+
+        watcher = Watcher(self.src_dir, self.dst_dir, converter, interval=0.1)
+        # ブルームフィルタの偽陽性をシミュレート
+        watcher.fallback_files.add("test_eucjp.txt")
+        try:
+            watcher.start()
+            time.sleep(0.5)
+
+            modified_content = test_content + "これはUTF-8で編集されました。"
+            with open(dst_file, "w", encoding="utf-8") as f:
+                f.write(modified_content)
+
+            time.sleep(2.0)
+
+            with open(src_file, "rb") as f:
+                content = f.read()
+
+            decoded_content = content.decode("euc-jp")
+            self.assertEqual(decoded_content, modified_content)
+        finally:
+            watcher.stop()
+
     def test_fallback_charset_for_new_files(self) -> None:
         """
         新規ファイル作成時にfallback_charsetが正しく使用されるかのテスト
@@ -0,0 +1,159 @@
+"""
+ポーリングモードのWatcherのテスト
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from charcle.converter import Converter
+from charcle.watcher import Watcher
+
+
+class TestWatcherPolling(unittest.TestCase):
+    """
+    ポーリング監視と再起動時のmtimeキャッシュのテスト
+    """
+
+    def setUp(self) -> None:
+        """
+        テスト前の準備
+
+        mtimeキャッシュが実際のホームディレクトリを汚さず、テスト間で
+        共有されないよう、HOMEをテストディレクトリに差し替えます。
+        """
+        self.test_dir = tempfile.mkdtemp()
+        self.src_dir = os.path.join(self.test_dir, "src")
+        self.dst_dir = os.path.join(self.test_dir, "dst")
+        os.makedirs(self.src_dir)
+        os.makedirs(self.dst_dir)
+        self._env = patch.dict(os.environ, {"HOME": self.test_dir})
+        self._env.start()
+
+    def tearDown(self) -> None:
+        """
+        テスト後のクリーンアップ
+        """
+        self._env.stop()
+        shutil.rmtree(self.test_dir)
+
+    def _run_watcher(self, watcher: Watcher, duration: float) -> None:
+        """
+        ウォッチャーを起動し、duration秒後に停止します。
+
+        Args:
+            watcher: 起動するウォッチャー
+            duration: 停止までの秒数
+        """
+        watcher.start()
+        try:
+            time.sleep(duration)
+        finally:
+            watcher.stop()
+
+    def test_polling_detects_source_change(self) -> None:
+        """
+        ポーリング監視でソースファイルの変更が変換されるかのテスト
+        """
+        converter = Converter(to_encoding="shift-jis")
+        watcher = Watcher(
+            self.src_dir, self.dst_dir, converter, interval=0.1, use_polling=True
+        )
+        try:
+            watcher.start()
+            time.sleep(0.5)
+            src_file = os.path.join(self.src_dir, "test.txt")
+            with open(src_file, "w", encoding="utf-8") as f:
+                f.write("こんにちは、世界！")
+            time.sleep(2.0)
+            dst_file = os.path.join(self.dst_dir, "test.txt")
+            self.assertTrue(os.path.exists(dst_file))
+            with open(dst_file, "rb") as f:
+                content = f.read()
+            self.assertEqual(content.decode("shift-jis"), "こんにちは、世界！")
+        finally:
+            watcher.stop()
+
+    def test_manifest_is_not_synced_to_source(self) -> None:
+        """
+        宛先の変換マニフェストがソースへ書き戻されないかのテスト
+        """
+        src_file = os.path.join(self.src_dir, "test.txt")
+        with open(src_file, "w", encoding="utf-8") as f:
+            f.write("こんにちは、世界！")
+        converter = Converter(to_encoding="utf-8")
+        converter.convert_directory(self.src_dir, self.dst_dir)
+        manifest = os.path.join(self.dst_dir, ".charcle-cache.json")
+        self.assertTrue(os.path.exists(manifest))
+
+        watcher = Watcher(
+            self.src_dir, self.dst_dir, converter,
+            interval=0.1, use_polling=True, watch_dst=True,
+        )
+        self._run_watcher(watcher, 1.0)
+
+        self.assertFalse(
+            os.path.exists(os.path.join(self.src_dir, ".charcle-cache.json"))
+        )
+        self.assertTrue(os.path.exists(manifest))
+
+    def test_restart_without_dst_watch_keeps_files(self) -> None:
+        """
+        watch_dstを変えて再起動しても既存ファイルが削除されないかのテスト
+
+        前回のキャッシュにdst側のキーが残ったまま宛先監視なしで再起動すると、
+        走査されないキーがすべて削除扱いになり両ツリーが消える退行の検出用です。
+        """
+        src_file = os.path.join(self.src_dir, "test.txt")
+        with open(src_file, "w", encoding="utf-8") as f:
+            f.write("こんにちは、世界！")
+        converter = Converter(to_encoding="utf-8")
+        converter.convert_directory(self.src_dir, self.dst_dir)
+
+        watcher = Watcher(
+            self.src_dir, self.dst_dir, converter,
+            interval=0.1, use_polling=True, watch_dst=True,
+        )
+        self._run_watcher(watcher, 1.0)
+
+        restarted = Watcher(
+            self.src_dir, self.dst_dir, converter,
+            interval=0.1, use_polling=True, watch_dst=False,
+        )
+        self._run_watcher(restarted, 1.0)
+
+        self.assertTrue(os.path.exists(src_file))
+        self.assertTrue(os.path.exists(os.path.join(self.dst_dir, "test.txt")))
+
+    def test_restart_with_different_excludes_keeps_files(self) -> None:
+        """
+        除外パターンを変えて再起動しても対象外ファイルが削除されないかのテスト
+        """
+        log_file = os.path.join(self.src_dir, "app.log")
+        with open(log_file, "w", encoding="utf-8") as f:
+            f.write("log line")
+        converter = Converter(to_encoding="utf-8")
+        converter.convert_directory(self.src_dir, self.dst_dir)
+
+        watcher = Watcher(
+            self.src_dir, self.dst_dir, converter,
+            interval=0.1, use_polling=True, watch_dst=True,
+        )
+        self._run_watcher(watcher, 1.0)
+
+        excluding = Converter(to_encoding="utf-8", exclude_patterns=["*.log"])
+        restarted = Watcher(
+            self.src_dir, self.dst_dir, excluding,
+            interval=0.1, use_polling=True, watch_dst=True,
+        )
+        self._run_watcher(restarted, 1.0)
+
+        self.assertTrue(os.path.exists(log_file))
+        self.assertTrue(os.path.exists(os.path.join(self.dst_dir, "app.log")))
+
+
+if __name__ == "__main__":
+    unittest.main()